@@ -0,0 +1,161 @@
+import statistics
+import sys
+import time
+import timeit
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+from bson import ObjectId
+from mongoengine import connect
+
+from core.auth.crud.user import UserCrud
+from core.auth.models.permission import PermissionsEnum
+from core.auth.models.role import Permission, Role
+from core.auth.models.user import PublicKeyCredential, User
+from core.auth.utilities.auth_handler import AuthHandler
+from core.auth.utilities.password_pool import hash_password, verify_password
+from core.auth.utilities.permission_mask import RolePermissionMask
+from core.exception import PasswordHashingBusyError
+from core.lib.document_row import to_rows
+
+
+def legacy_has_permission(role, permission):
+    return permission.value in [
+        {"value": i.value, "display_name": i.display_name} for i in role.permissions
+    ]
+
+
+def permissions(number=100000):
+    role = Role(
+        id=ObjectId(),
+        name="benchmark",
+        permissions=[Permission(**item.value) for item in PermissionsEnum],
+    )
+    # last permission is the worst case for the list scan
+    permission = list(PermissionsEnum)[-1]
+    print(f"{len(role.permissions)} permissions, {number} checks")
+    for name, check in (
+        ("list-scan", legacy_has_permission),
+        ("bitmask", RolePermissionMask.has_permission),
+    ):
+        seconds = timeit.timeit(lambda: check(role, permission), number=number)
+        print(f"{name}\t{seconds / number * 1e6:.2f} us/check")
+
+
+def insert_users(number: int):
+    # a separate database so the app's collections are left alone
+    connect("benchmark", host="mongodb://mongo:27017/")
+    collection = User._get_collection()
+    collection.drop()
+    collection.insert_many(
+        [
+            User(
+                email=f"user{index}@example.com",
+                password="x" * 60,
+                role=ObjectId(),
+                account=ObjectId(),
+                public_key_credential=PublicKeyCredential(
+                    id="id",
+                    public_key="key",
+                    username=f"user{index}@example.com",
+                    sign_count=0,
+                    device_type="single_device",
+                    backed_up=False,
+                    transports=["internal"],
+                ),
+            ).to_mongo()
+            for index in range(number)
+        ]
+    )
+    return collection
+
+
+def login(number=200, concurrency=32):
+    collection = insert_users(100)
+    hashed = hash_password("benchmark")
+    # spawn the pool workers before timing
+    AuthHandler.verify_password("benchmark", hashed)
+
+    def attempt(check):
+        try:
+            return check("benchmark", hashed)
+        except PasswordHashingBusyError:
+            return None
+
+    def read(submitted):
+        # the crud calls behind the me and users queries
+        UserCrud.get(email="user0@example.com")
+        UserCrud.get_many_partial_with_pagination(
+            {}, {"email", "account"}, limit=10, as_rows=True
+        )
+        return (time.perf_counter() - submitted) * 1000
+
+    print(f"{number} logins and {number} reads, {concurrency} concurrent")
+    p50, p99 = get_percentiles([read(time.perf_counter()) for _ in range(number)])
+    print(f"idle\tread p50 {p50:.1f} ms p99 {p99:.1f} ms")
+    for name, check in (
+        ("inline", verify_password),
+        ("pool", AuthHandler.verify_password),
+    ):
+        # logins and reads share one pool, as requests share the threadpool
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            logins, reads = [], []
+            for _ in range(number):
+                logins.append(executor.submit(attempt, check))
+                reads.append(executor.submit(read, time.perf_counter()))
+            results = [future.result() for future in logins]
+            seconds = time.perf_counter() - started
+            p50, p99 = get_percentiles([future.result() for future in reads])
+        print(
+            f"{name}\t{results.count(True) / seconds:.1f} logins/s"
+            f"\t{results.count(None)} rejected as busy"
+            f"\tread p50 {p50:.1f} ms p99 {p99:.1f} ms"
+        )
+    collection.drop()
+
+
+def get_percentiles(latencies: list[float]) -> tuple[float, float]:
+    percentiles = statistics.quantiles(latencies, n=100)
+    return percentiles[49], percentiles[98]
+
+
+def rows(number=10000):
+    collection = insert_users(number)
+    query_set = User.objects.filter(is_deleted=False)
+    print(f"{number} users")
+    for name, load in (
+        ("documents", lambda: [User._from_son(son) for son in query_set.as_pymongo()]),
+        ("rows", lambda: to_rows(User, list(query_set.as_pymongo()))),
+    ):
+        started = time.perf_counter()
+        load()
+        seconds = time.perf_counter() - started
+        # traced separately, tracemalloc slows the timed run down
+        tracemalloc.start()
+        load()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{name}\t{seconds * 1000:.0f} ms\t{peak / 2**20:.1f} MiB peak")
+    collection.drop()
+
+
+def help():
+    print("Usage: benchmark.py [option]")
+    print("Options:")
+    print("\tpermissions\tCompare bitmask and list-scan permission checks")
+    print("\tlogin\t\tCompare password checks inline and in the hashing pool")
+    print("\trows\t\tCompare loading users as documents and as rows")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        help()
+    elif sys.argv[1] == "permissions":
+        permissions()
+    elif sys.argv[1] == "login":
+        login()
+    elif sys.argv[1] == "rows":
+        rows()
+    else:
+        help()
@@ -0,0 +1,70 @@
+from datetime import datetime
+
+from bson import ObjectId
+from pymongo import ReplaceOne
+
+from core.basemodel import BaseModel
+from core.lib.index_manager import IndexManager
+
+
+class Archiver:
+    @staticmethod
+    def get_models() -> list[type[BaseModel]]:
+        return [
+            model for model in IndexManager.get_models() if model._meta.get("archive")
+        ]
+
+    @staticmethod
+    def get_archive_collection(model: type[BaseModel]):
+        return model._get_db()[model.get_archive_collection_name()]
+
+    @classmethod
+    def archive(
+        cls, model: type[BaseModel], deleted_before: datetime, batch_size: int
+    ) -> int:
+        collection = model._get_collection()
+        archive_collection = cls.get_archive_collection(model)
+        archived = 0
+        while sons := list(
+            collection.find(
+                {"is_deleted": True, "deleted_at": {"$lt": deleted_before}},
+                limit=batch_size,
+            )
+        ):
+            ids = [son["_id"] for son in sons]
+            archive_collection.bulk_write(
+                [ReplaceOne({"_id": son["_id"]}, son, upsert=True) for son in sons],
+                ordered=False,
+            )
+            deleted = collection.delete_many(
+                {"_id": {"$in": ids}, "is_deleted": True}
+            ).deleted_count
+            if deleted != len(ids):
+                restored = collection.distinct("_id", {"_id": {"$in": ids}})
+                archive_collection.delete_many({"_id": {"$in": restored}})
+            archived += deleted
+        return archived
+
+    @classmethod
+    def find_deleted(cls, model: type[BaseModel], id: str) -> BaseModel | None:
+        query = {"_id": ObjectId(id)}
+        son = model._get_collection().find_one(
+            {**query, "is_deleted": True}
+        ) or cls.get_archive_collection(model).find_one(query)
+        return son and model._from_son(son)
+
+    @classmethod
+    def restore(cls, document: BaseModel):
+        model = document.__class__
+        collection = model._get_collection()
+        restored = {"$set": {"is_deleted": False}, "$unset": {"deleted_at": ""}}
+        if collection.update_one(
+            {"_id": document.pk, "is_deleted": True}, restored
+        ).matched_count:
+            return
+        archive_collection = cls.get_archive_collection(model)
+        if son := archive_collection.find_one({"_id": document.pk}):
+            son["is_deleted"] = False
+            son.pop("deleted_at", None)
+            collection.insert_one(son)
+            archive_collection.delete_one({"_id": document.pk})
@@ -0,0 +1,21 @@
+from datetime import datetime, timedelta
+
+from core.archive.archiver import Archiver
+from core.celery_app import app
+from core.config import settings
+from core.functions import initialize_logger
+
+logger = initialize_logger()
+
+
+@app.task(name="core.archive.tasks.archive_deleted_documents")
+def archive_deleted_documents():
+    deleted_before = datetime.utcnow() - timedelta(seconds=settings.ARCHIVE_AFTER)
+    for model in Archiver.get_models():
+        if archived := Archiver.archive(
+            model, deleted_before, settings.ARCHIVE_BATCH_SIZE
+        ):
+            logger.info(
+                f"Archived {archived} documents into "
+                f"{model.get_archive_collection_name()}"
+            )
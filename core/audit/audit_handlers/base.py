@@ -6,6 +6,14 @@ from mongoengine import Document
 from core.audit.crud.audit import AuditCrud
 from core.audit.enum import ActivityTypesEnum
 from core.auth.models.user import User
+from core.lib.search import SearchableModel
+
+
+def get_audit_dict(document: Document) -> dict:
+    audit_dict = document.to_mongo().to_dict()
+    if isinstance(document, SearchableModel):
+        audit_dict.pop(document._fields["search_tokens"].db_field, None)
+    return audit_dict
 
 
 class BaseAuditHandler:
@@ -22,6 +30,41 @@ class BaseAuditHandler:
     ):
         if not is_audit:
             return
+        AuditCrud.create(
+            cls.get_create_audit_fields(
+                document, created_by, source_address, user_agent
+            )
+        )
+
+    @classmethod
+    def create_audits_for_bulk_create_opr(
+        cls,
+        sender: Document.__class__,
+        documents: list[Document],
+        created_by: User | None = None,
+        source_address: str | None = None,
+        user_agent: str | None = None,
+        is_audit=False,
+    ):
+        if not is_audit:
+            return
+        AuditCrud.create_many(
+            [
+                cls.get_create_audit_fields(
+                    document, created_by, source_address, user_agent
+                )
+                for document in documents
+            ]
+        )
+
+    @classmethod
+    def get_create_audit_fields(
+        cls,
+        document: Document,
+        created_by: User | None,
+        source_address: str | None,
+        user_agent: str | None,
+    ) -> dict:
         audit_fields = {}
         audit_data_fields = []
         audit_fields["source_address"] = source_address
@@ -30,7 +73,7 @@ class BaseAuditHandler:
         audit_fields["model"] = document
         audit_fields["activity"] = ActivityTypesEnum.CREATE
         audit_fields["model_name"] = document._class_name
-        audit_dict = document.to_mongo().to_dict()
+        audit_dict = get_audit_dict(document)
         for field, new_value in audit_dict.items():
             audit_data_fields.append(
                 {
@@ -43,7 +86,7 @@ class BaseAuditHandler:
         ] = f"{{0}} {str(document.__class__.__name__).lower()} created."
         audit_fields["params"] = [document]
         audit_fields["data"] = audit_data_fields
-        AuditCrud.create(audit_fields)
+        return audit_fields
 
     @classmethod
     def create_audit_for_update_opr(
@@ -58,6 +101,49 @@ class BaseAuditHandler:
     ):
         if not is_audit or not update_fields:
             return
+        AuditCrud.create(
+            cls.get_update_audit_fields(
+                sender, document, update_fields, created_by, source_address, user_agent
+            )
+        )
+
+    @classmethod
+    def create_audits_for_bulk_update_opr(
+        cls,
+        sender: Document.__class__,
+        changes: list[tuple[Document, dict]],
+        created_by: User | None = None,
+        source_address: str | None = None,
+        user_agent: str | None = None,
+        is_audit=False,
+    ):
+        if not is_audit:
+            return
+        AuditCrud.create_many(
+            [
+                cls.get_update_audit_fields(
+                    sender,
+                    document,
+                    update_fields,
+                    created_by,
+                    source_address,
+                    user_agent,
+                )
+                for document, update_fields in changes
+                if update_fields
+            ]
+        )
+
+    @classmethod
+    def get_update_audit_fields(
+        cls,
+        sender: Document.__class__,
+        document: Document,
+        update_fields: dict,
+        created_by: User | None,
+        source_address: str | None,
+        user_agent: str | None,
+    ) -> dict:
         audit_fields = {}
         audit_data_fields = []
         audit_fields["source_address"] = source_address
@@ -92,7 +178,7 @@ class BaseAuditHandler:
         audit_fields["activity"] = ActivityTypesEnum.UPDATE
         audit_fields["created_by"] = created_by
         audit_fields["model"] = document
-        AuditCrud.create(audit_fields)
+        return audit_fields
 
     @classmethod
     def create_audit_for_delete_opr(
@@ -106,12 +192,47 @@ class BaseAuditHandler:
     ):
         if not is_audit:
             return
+        AuditCrud.create(
+            cls.get_delete_audit_fields(
+                document, created_by, source_address, user_agent
+            )
+        )
+
+    @classmethod
+    def create_audits_for_bulk_delete_opr(
+        cls,
+        sender: Document.__class__,
+        documents: list[Document],
+        created_by: User | None = None,
+        source_address: str | None = None,
+        user_agent: str | None = None,
+        is_audit=False,
+    ):
+        if not is_audit:
+            return
+        AuditCrud.create_many(
+            [
+                cls.get_delete_audit_fields(
+                    document, created_by, source_address, user_agent
+                )
+                for document in documents
+            ]
+        )
+
+    @classmethod
+    def get_delete_audit_fields(
+        cls,
+        document: Document,
+        created_by: User | None,
+        source_address: str | None,
+        user_agent: str | None,
+    ) -> dict:
         audit_fields = {}
         audit_data_fields = []
         audit_fields["source_address"] = source_address
         audit_fields["source_user_agent"] = user_agent
         audit_fields["created_by"] = created_by
-        document_dict = document.to_mongo().to_dict()
+        document_dict = get_audit_dict(document)
         for field, old_value in document_dict.items():
             audit_data_fields.append(
                 {
@@ -125,5 +246,4 @@ class BaseAuditHandler:
             "message"
         ] = f"{{0}} {str(document.__class__.__name__).lower()} removed."
         audit_fields["params"] = [document]
-
-        AuditCrud.create(audit_fields)
+        return audit_fields
@@ -39,18 +39,15 @@ class UserAuditHandler(BaseAuditHandler):
         AuditCrud.create(audit_fields)
 
     @classmethod
-    def create_audit_for_update_opr(
+    def get_update_audit_fields(
         cls,
         sender: Document.__class__,
         document: Document,
         update_fields: dict,
-        created_by: User | None = None,
-        source_address: str | None = None,
-        user_agent: str | None = None,
-        is_audit=False,
-    ):
-        if not is_audit or not update_fields:
-            return
+        created_by: User | None,
+        source_address: str | None,
+        user_agent: str | None,
+    ) -> dict:
         audit_fields = {}
         audit_data_fields = []
         audit_fields["source_address"] = source_address
@@ -97,4 +94,4 @@ class UserAuditHandler(BaseAuditHandler):
         audit_fields["data"] = audit_data_fields
         audit_fields["created_by"] = created_by
         audit_fields["model"] = document
-        AuditCrud.create(audit_fields)
+        return audit_fields
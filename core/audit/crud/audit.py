@@ -5,11 +5,14 @@ from bson.objectid import ObjectId
 from core.audit.models.audit import Audit
 from core.auth.crud.user import UserCrud
 from core.auth.models.user import User
+from core.config import settings
+from core.lib.async_basecrud import AsyncCrud
 from core.lib.basecrud import Crud
 from core.exception import InvalidObjectId
 
 class AuditCrud(Crud):
     model = Audit
+    count_limit = settings.AUDIT_COUNT_LIMIT
 
     @classmethod
     def create(cls, audit: dict) -> Audit:
@@ -17,6 +20,10 @@ class AuditCrud(Crud):
         audit_model.save()
         return audit_model
 
+    @classmethod
+    def create_many(cls, audits: list[dict]) -> list[Audit]:
+        return cls.bulk_create([cls.model(**audit) for audit in audits])
+
     @classmethod
     def get_many_partial_with_pagination(
         cls,
@@ -26,11 +33,22 @@ class AuditCrud(Crud):
         limit: int = 0,
         order_by: Optional[list] = None,
         search_text: Optional[str] = None,
-    ) -> tuple[list, bool]:
+        cursor: Optional[str] = None,
+        with_count: bool = True,
+        as_rows: bool = False,
+    ) -> tuple[list, bool, int | None, str | None]:
         if "users" in query:
             query["created_by__in"] = cls.get_users_instance(query.pop("users"))
         return super().get_many_partial_with_pagination(
-            query, fields, offset, limit, order_by, search_text=search_text
+            query,
+            fields,
+            offset,
+            limit,
+            order_by,
+            search_text=search_text,
+            cursor=cursor,
+            with_count=with_count,
+            as_rows=as_rows,
         )
 
     @classmethod
@@ -43,3 +61,36 @@ class AuditCrud(Crud):
                 InvalidObjectId(user)
         return UserCrud.get_many({"id__in": users_id})
 
+
+class AsyncAuditCrud(AsyncCrud):
+    model = Audit
+    count_limit = settings.AUDIT_COUNT_LIMIT
+
+    @classmethod
+    async def get_many_partial_with_pagination(
+        cls,
+        query: dict,
+        fields: set,
+        offset: int = 0,
+        limit: int = 0,
+        order_by: Optional[list] = None,
+        search_text: Optional[str] = None,
+        cursor: Optional[str] = None,
+        with_count: bool = True,
+        as_rows: bool = False,
+    ) -> tuple[list, bool, int | None, str | None]:
+        if "users" in query:
+            query["created_by__in"] = [
+                user for user in query.pop("users") if ObjectId.is_valid(user)
+            ]
+        return await super().get_many_partial_with_pagination(
+            query,
+            fields,
+            offset,
+            limit,
+            order_by,
+            search_text=search_text,
+            cursor=cursor,
+            with_count=with_count,
+            as_rows=as_rows,
+        )
@@ -18,6 +18,7 @@ from core.graphql_base_model import (
     BaseRead,
     StrawberryFieldConverter,
 )
+from core.lib.dataloader import reference_resolver
 
 ModelRead = strawberry.union(
     "ModelRead",
@@ -39,7 +40,9 @@ ParamTypeAudit = strawberry.union(
 
 @strawberry.type
 class AuditRead(BaseRead):
-    created_by: Optional[UserRead] = strawberry.UNSET
+    created_by: Optional[UserRead] = strawberry.field(
+        resolver=reference_resolver("created_by", User)
+    )
     activity: Optional[str] = strawberry.UNSET
     source_address: Optional[str] = strawberry.UNSET
     source_user_agent: Optional[str] = strawberry.UNSET
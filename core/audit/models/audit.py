@@ -17,7 +17,8 @@ from core.audit.enum import ActivityTypesEnum
 from core.auth.models.account import Account
 from core.auth.models.role import Role
 from core.auth.models.user import User
-from core.basemodel import BaseModel
+from core.basemodel import not_deleted_index
+from core.lib.search import SearchableModel
 
 
 class DataRecord(EmbeddedDocument):
@@ -26,16 +27,16 @@ class DataRecord(EmbeddedDocument):
     new = DynamicField()
 
 
-class Audit(BaseModel):
+class Audit(SearchableModel):
     meta = {
         "collection": "audits",
         "indexes": [
-            {
-                "fields": ["$message", "$source_user_agent", "$source_address"],
-                "default_language": "english",
-            }
+            not_deleted_index("created_by", "-id"),
+            not_deleted_index("-created_at"),
+            not_deleted_index("search_tokens"),
         ],
     }
+    search_fields = ("message", "source_user_agent", "source_address")
     created_by = ReferenceField(User, required=True, reverse_delete_rule=CASCADE)
     time = DateTimeField(default=datetime.utcnow)
     model = GenericReferenceField(
@@ -2,7 +2,7 @@ from typing import Optional
 
 from strawberry.types import Info
 
-from core.audit.crud.audit import AuditCrud
+from core.audit.crud.audit import AsyncAuditCrud
 from core.audit.graphql_models.audit import (
     AuditList,
     AuditListResponse,
@@ -10,15 +10,16 @@ from core.audit.graphql_models.audit import (
 )
 from core.auth.models.permission import PermissionsEnum
 from core.auth.utilities.decorators import check_perm
-from core.utils import get_requested_fields
+from core.utils import get_requested_fields, is_field_requested
 from core.filter_lookup import build_query
+from core.lib.pagination import is_count_approximate
 from core.graphql_base_model import BaseGraphQLQueryMeta, BaseGraphQLQueryMetaInput
 from core.graphql_decorator import graphql_exception_handler
 
 
 @graphql_exception_handler
 @check_perm(PermissionsEnum.AUDIT_READ_VALUES)
-def resolve_audits(
+async def resolve_audits(
     info: Info,
     query: AuditQuery,
     meta: Optional[BaseGraphQLQueryMetaInput] = None,
@@ -28,10 +29,28 @@ def resolve_audits(
         meta = BaseGraphQLQueryMetaInput()
     query_dict = build_query(query.to_dict())
     requested_fields = get_requested_fields(info, "AuditList")
-    audits, has_more, count = AuditCrud.get_many_partial_with_pagination(
-        query_dict, requested_fields, **meta.to_dict(), search_text=search_text
+    (
+        audits,
+        has_more,
+        count,
+        next_cursor,
+    ) = await AsyncAuditCrud.get_many_partial_with_pagination(
+        query_dict,
+        requested_fields,
+        **meta.to_dict(),
+        search_text=search_text,
+        with_count=is_field_requested(info, "AuditList", "count"),
+        as_rows=True,
     )
     return AuditList(
         response=audits,
-        meta=BaseGraphQLQueryMeta(**meta.to_dict(), has_more=has_more, count=count),
+        meta=BaseGraphQLQueryMeta(
+            **meta.to_dict(),
+            has_more=has_more,
+            count=count,
+            is_count_approximate=is_count_approximate(
+                count, AsyncAuditCrud.count_limit
+            ),
+            next_cursor=next_cursor,
+        ),
     )
@@ -14,6 +14,4 @@ class AccountCrud(Crud):
     @classmethod
     def update(cls, query: dict, update_fields: dict) -> Account:
         cls.validate(update_fields)
-        account = cls.get(**query)
-        account.modify(update_fields)
-        return account
+        return cls.modify_one(query, update_fields)
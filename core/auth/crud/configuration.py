@@ -1,9 +1,11 @@
 from core.auth.models.configuration import Configuration
+from core.config import settings
 from core.lib.basecrud import Crud
 
 
 class ConfigurationCrud(Crud):
     model = Configuration
+    cache_ttl = settings.QUERY_CACHE_TTL
 
     @classmethod
     def create(cls, configuration: dict) -> Configuration:
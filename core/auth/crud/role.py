@@ -1,20 +1,43 @@
 from core.auth.models.role import Role
+from core.auth.utilities.permission_mask import RolePermissionMask
+from core.config import settings
+from core.lib.async_basecrud import AsyncCrud
 from core.lib.basecrud import Crud
 
 
 class RoleCrud(Crud):
     model = Role
+    cache_ttl = settings.QUERY_CACHE_TTL
 
     @classmethod
     def create(cls, role: dict, signal_kwargs: None | dict = None) -> Role:
         role_model = Role(**role)
-        return cls.create_by_uniqueness(role_model, {"name":role['name']}, signal_kwargs=signal_kwargs)
+        return cls.create_by_uniqueness(role_model, signal_kwargs=signal_kwargs)
 
     @classmethod
     def update(
         cls, query: dict, update_fields: dict, signal_kwargs: None | dict = None
     ) -> Role:
         cls.validate(update_fields)
-        role = cls.get(**query)
-        role.modify(update_fields, signal_kwargs=signal_kwargs)
+        role = cls.modify_one(query, update_fields, signal_kwargs=signal_kwargs)
+        if "permissions" in update_fields:
+            RolePermissionMask.compile(role)
         return role
+
+    @classmethod
+    def bulk_update(
+        cls, updates: dict[str, dict], signal_kwargs: None | dict = None
+    ) -> list[Role]:
+        roles = super().bulk_update(updates, signal_kwargs=signal_kwargs)
+        for role in roles:
+            RolePermissionMask.compile(role)
+        return roles
+
+    @classmethod
+    def restore(cls, id: str, signal_kwargs: None | dict = None) -> Role:
+        return super().restore(id, unique_field="name", signal_kwargs=signal_kwargs)
+
+
+class AsyncRoleCrud(AsyncCrud):
+    model = Role
+    cache_ttl = settings.QUERY_CACHE_TTL
@@ -1,14 +1,22 @@
 from datetime import datetime
 
+from bson import ObjectId
 from mongoengine import signals
 
 from core.auth.crud.account import AccountCrud
 from core.auth.crud.role import RoleCrud
 from core.auth.enum import NotStrongPasswordErrorMessage
+from core.auth.models.account import Account
 from core.auth.models.user import User
 from core.auth.utilities.auth_handler import AuthHandler
 from core.auth.utilities.utilities import is_strong_password
-from core.exception import NotAddExistingUser, NotStrongPasswordError
+from core.config import settings
+from core.exception import (
+    BulkLimitExceededError,
+    NotAddExistingUser,
+    NotStrongPasswordError,
+)
+from core.lib.async_basecrud import AsyncCrud
 from core.lib.basecrud import Crud
 
 
@@ -17,24 +25,26 @@ class UserCrud(Crud):
 
     @classmethod
     def create(cls, user: dict, signal_kwargs: None | dict = None) -> User:
-        if cls.find(email=user["email"]):
-            raise NotAddExistingUser()
         role = RoleCrud.get(id=user.pop("role"))
 
-        user["account"] = AccountCrud.create(user["account"])
+        account = Account(id=ObjectId(), **user["account"])
+        account.validate()
+        user["account"] = account
         user["role"] = role
         user["password"] = AuthHandler.get_password_hash(user["password"])
-        user_model = User(**user)
-        return cls.create_by_uniqueness(
-            user_model, {"email": user["email"]}, signal_kwargs=signal_kwargs
-        )
+        user_model = cls.create_by_uniqueness(User(**user), signal_kwargs=signal_kwargs)
+        account.save()
+        return user_model
+
+    @classmethod
+    def get_unique_exception(cls) -> NotAddExistingUser:
+        return NotAddExistingUser()
 
     @classmethod
     def update(
         cls, query: dict, update_fields: dict, signal_kwargs: None | dict = None
     ) -> User:
         cls.validate(update_fields)
-        user = cls.get(**query)
 
         if "password" in update_fields:
             response = is_strong_password(update_fields["password"])
@@ -47,19 +57,82 @@ class UserCrud(Crud):
         if "role" in update_fields:
             update_fields["role"] = RoleCrud.get(id=update_fields.pop("role"))
 
-        if "account" in update_fields:
-            account = AccountCrud.get_partial({"id": user.account.id}, {"id"})
+        account_fields = update_fields.pop("account", None)
+        user = cls.modify_one(query, update_fields, signal_kwargs=signal_kwargs)
+        if account_fields:
             AccountCrud.update(
-                {"id": account.id}, update_fields=update_fields.pop("account")
+                {"id": user._data["account"].id}, update_fields=account_fields
             )
-
-        user.modify(update_fields, signal_kwargs=signal_kwargs)
         return user
 
     @classmethod
     def delete(cls, id: str, signal_kwargs: None | dict = None) -> bool:
         user = cls.get(id=id)
         user.update(is_deleted=True, deleted_at=datetime.utcnow)
-        signals.post_delete.send(user.__class__, document=user, **signal_kwargs)
+        signals.post_delete.send(user.__class__, document=user, **(signal_kwargs or {}))
         AccountCrud.delete(id=user.account.id, signal_kwargs=signal_kwargs)
         return True
+
+    @classmethod
+    def bulk_create(
+        cls, users: list[dict], signal_kwargs: None | dict = None
+    ) -> list[User]:
+        if len(users) > settings.USER_BULK_CREATE_LIMIT:
+            raise BulkLimitExceededError(settings.USER_BULK_CREATE_LIMIT)
+        emails = [user["email"] for user in users]
+        if len(set(emails)) != len(emails) or cls.count(email__in=emails):
+            raise NotAddExistingUser()
+        roles = {
+            str(role.id): role
+            for role in RoleCrud.get_many_by_ids([user["role"] for user in users])
+        }
+        accounts = [Account(id=ObjectId(), **user["account"]) for user in users]
+        for account in accounts:
+            account.validate()
+        passwords = AuthHandler.get_password_hashes(
+            [user["password"] for user in users]
+        )
+        documents = [
+            User(
+                **{
+                    **user,
+                    "role": roles[str(ObjectId(user["role"]))],
+                    "account": account,
+                    "password": password,
+                }
+            )
+            for user, account, password in zip(users, accounts, passwords)
+        ]
+        # accounts follow the users that were written, as in create
+        try:
+            return super().bulk_create(documents, signal_kwargs=signal_kwargs)
+        finally:
+            AccountCrud.bulk_create(
+                [user._data["account"] for user in documents if user.pk]
+            )
+
+    @classmethod
+    def bulk_soft_delete(
+        cls, ids: list[str], signal_kwargs: None | dict = None
+    ) -> list[User]:
+        users = super().bulk_soft_delete(ids, signal_kwargs=signal_kwargs)
+        AccountCrud.bulk_soft_delete(
+            [user._data["account"].id for user in users if user._data["account"]],
+            signal_kwargs=signal_kwargs,
+        )
+        return users
+
+    @classmethod
+    def restore(cls, id: str, signal_kwargs: None | dict = None) -> User:
+        user = cls.get_deleted(id)
+        if cls.find(email=user.email):
+            raise NotAddExistingUser()
+        if user._data["account"] and (
+            account := AccountCrud.find_deleted(user._data["account"].id)
+        ):
+            AccountCrud.restore_document(account, signal_kwargs=signal_kwargs)
+        return cls.restore_document(user, signal_kwargs=signal_kwargs)
+
+
+class AsyncUserCrud(AsyncCrud):
+    model = User
@@ -34,6 +34,11 @@ class RoleList:
     meta: BaseGraphQLQueryMeta
 
 
+@strawberry.type
+class RoleBulkRead:
+    response: list[RoleRead]
+
+
 @strawberry.input
 class RoleCreate(BaseRole, BaseGraphQLModel):
     permissions: list[str]
@@ -49,6 +54,12 @@ class RoleQuery(RoleUpdate):
     id: Optional[strawberry.ID] = strawberry.UNSET
 
 
+@strawberry.input
+class RoleBulkUpdate:
+    id: strawberry.ID
+    set: RoleUpdate
+
+
 ############################################
 ########## Mutation Return Types ###########
 ############################################
@@ -77,3 +88,8 @@ RoleUpdateResponse = strawberry.union(
     "RoleUpdateResponse",
     mutation_responses,
 )
+
+RoleBulkUpdateResponse = strawberry.union(
+    "RoleBulkUpdateResponse",
+    (RoleBulkRead, BaseErrorType, AuthenticationExceptionType),
+)
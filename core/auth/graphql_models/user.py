@@ -9,6 +9,8 @@ from core.auth.graphql_models.account import (
     AccountUpdate,
 )
 from core.auth.graphql_models.role import RoleRead
+from core.auth.models.account import Account
+from core.auth.models.role import Role
 from core.auth.resolvers.webauthn import PublicKeyCredentialRequestOptions
 from core.base_graphql_error import AuthenticationExceptionType, BaseErrorType
 from core.graphql_base_model import (
@@ -17,6 +19,7 @@ from core.graphql_base_model import (
     BaseGraphQLQueryMeta,
     BaseRead,
 )
+from core.lib.dataloader import reference_resolver
 
 
 @strawberry.type
@@ -24,14 +27,15 @@ class BaseUser:
     is_superuser: bool
     email: str
     user_type: UserTypeEnum
-    role: RoleRead
-    account: AccountRead
     is_two_factor_auth_enabled: bool
 
 
 @strawberry.type
 class UserRead(BaseUser, BaseRead):
-    pass
+    role: RoleRead = strawberry.field(resolver=reference_resolver("role", Role))
+    account: AccountRead = strawberry.field(
+        resolver=reference_resolver("account", Account)
+    )
 
 
 @strawberry.type
@@ -45,6 +49,11 @@ class UserList:
     meta: BaseGraphQLQueryMeta
 
 
+@strawberry.type
+class UserBulkRead:
+    response: list[UserRead]
+
+
 @strawberry.input
 class UserCreate(BaseUser, BaseGraphQLModel):
     account: AccountCreate
@@ -81,6 +90,7 @@ class Login:
     access_token: Optional[str] = strawberry.UNSET
     refresh_token: Optional[str] = strawberry.UNSET
     mfa_type: Optional[str] = "None"
+    session_id: Optional[str] = strawberry.UNSET
 
 
 @strawberry.type
@@ -124,6 +134,11 @@ UserCreateResponse = strawberry.union(
     (UserRead, *mutation_error_responses),
 )
 
+UserBulkCreateResponse = strawberry.union(
+    "UserBulkCreateResponse",
+    (UserBulkRead, *mutation_error_responses),
+)
+
 UserUpdateResponse = strawberry.union(
     "UserUpdateResponse", (UserRead, *mutation_error_responses)
 )
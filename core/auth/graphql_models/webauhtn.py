@@ -131,11 +131,13 @@ class PublicKeyCredentialRequestOptions:
     user_verification: Optional[
         ValidateEnumStr[UserVerificationRequirement]
     ] = UserVerificationRequirement.PREFERRED
+    session_id: Optional[str] = None
 
 
 @strawberry.input
 class OptionsInput:
     email: str
+    session_id: str
 
 
 @strawberry.input
@@ -219,6 +221,7 @@ class WebAuthnInput:
 @strawberry.input
 class AuthenticationInput(BaseGraphQLModel):
     email: str
+    session_id: str
     credential: Optional[AuthenticationCredential] = strawberry.UNSET
     digit_code: Optional[int] = strawberry.UNSET
 
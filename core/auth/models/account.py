@@ -1,6 +1,7 @@
 from mongoengine import EmbeddedDocument, EmbeddedDocumentField, StringField
 
-from core.basemodel import BaseModel
+from core.basemodel import deleted_index, not_deleted_index
+from core.lib.search import SearchableModel
 
 
 class Avatar(EmbeddedDocument):
@@ -8,16 +9,16 @@ class Avatar(EmbeddedDocument):
     path = StringField(required=True)
 
 
-class Account(BaseModel):
+class Account(SearchableModel):
     meta = {
         "collection": "accounts",
+        "archive": True,
         "indexes": [
-            {
-                "fields": ["$firstname", "$lastname", "$phone", "$job_title"],
-                "default_language": "english",
-            }
+            not_deleted_index("search_tokens"),
+            deleted_index("deleted_at"),
         ],
     }
+    search_fields = ("firstname", "lastname", "phone", "job_title")
     firstname = StringField(required=True)
     lastname = StringField(required=True)
     phone = StringField()
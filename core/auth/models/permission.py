@@ -52,8 +52,18 @@ class PermissionsEnum(Enum):
         "value": "configuration.delete",
         "display_name": "Can Delete Configuration",
     }
+    MONITORING_READ_VALUES = {
+        "value": "monitoring.read",
+        "display_name": "Can Read Monitoring",
+    }
 
 
 PERMISSION_VALUE_TO_DISPLAY_NAME = {
     item.value["value"]: item.value["display_name"] for item in PermissionsEnum
 }
+
+# bit positions follow declaration order, new permissions must be appended
+PERMISSION_VALUE_TO_BIT = {
+    item.value["value"]: 1 << position
+    for position, item in enumerate(PermissionsEnum)
+}
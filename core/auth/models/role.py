@@ -1,6 +1,7 @@
 from mongoengine import EmbeddedDocument, StringField
 
-from core.basemodel import BaseModel, EmbeddedDocumentListField
+from core.basemodel import EmbeddedDocumentListField, deleted_index, not_deleted_index
+from core.lib.search import SearchableModel
 
 
 class Permission(EmbeddedDocument):
@@ -8,16 +9,17 @@ class Permission(EmbeddedDocument):
     display_name = StringField(required=True)
 
 
-class Role(BaseModel):
+class Role(SearchableModel):
     meta = {
         "collection": "roles",
+        "archive": True,
         "indexes": [
-            {
-                "fields": ["$name", "$description"],
-                "default_language": "english",
-            }
+            not_deleted_index("name", unique=True, name="name_unique"),
+            not_deleted_index("search_tokens"),
+            deleted_index("deleted_at"),
         ],
     }
+    search_fields = ("name", "description")
     name = StringField(required=True)
     permissions = EmbeddedDocumentListField(Permission, required=True)
     description = StringField()
@@ -15,7 +15,8 @@ from mongoengine import (
 from core.auth.enum import UserTypeEnum
 from core.auth.models.account import Account
 from core.auth.models.role import Role
-from core.basemodel import BaseModel
+from core.basemodel import deleted_index, not_deleted_index
+from core.lib.search import SearchableModel
 
 
 class PublicKeyCredential(EmbeddedDocument):
@@ -29,16 +30,19 @@ class PublicKeyCredential(EmbeddedDocument):
     transports = ListField(StringField(), required=True)
 
 
-class User(BaseModel):
+class User(SearchableModel):
     meta = {
         "collection": "users",
+        "archive": True,
         "indexes": [
-            {
-                "fields": ["$email"],
-                "default_language": "english",
-            }
+            not_deleted_index("email", unique=True, name="email_unique"),
+            not_deleted_index("role"),
+            not_deleted_index("account"),
+            not_deleted_index("search_tokens"),
+            deleted_index("deleted_at"),
         ],
     }
+    search_fields = ("email",)
     is_superuser = BooleanField(default=False)
     email = EmailField(required=True)
     password = StringField(required=True)
@@ -25,6 +25,7 @@ from core.auth.utilities.utilities import resize_image
 from core.utils import (
     db_to_graphql_type_converter,
     get_requested_fields,
+    is_field_requested,
 )
 from core.exception import UnsupportedImage
 from core.graphql_base_model import (
@@ -49,12 +50,27 @@ def resolve_account(
     if not meta:
         meta = BaseGraphQLQueryMetaInput()
     requested_fields = get_requested_fields(info, "AccountList")
-    accounts, has_more, count = AccountCrud.get_many_partial_with_pagination(
-        query.to_dict(), requested_fields, **meta.to_dict(), search_text=search_text
+    (
+        accounts,
+        has_more,
+        count,
+        next_cursor,
+    ) = AccountCrud.get_many_partial_with_pagination(
+        query.to_dict(),
+        requested_fields,
+        **meta.to_dict(),
+        search_text=search_text,
+        with_count=is_field_requested(info, "AccountList", "count"),
+        as_rows=True,
     )
     return AccountList(
         response=accounts,
-        meta=BaseGraphQLQueryMeta(**meta.to_dict(), has_more=has_more, count=count),
+        meta=BaseGraphQLQueryMeta(
+            **meta.to_dict(),
+            has_more=has_more,
+            count=count,
+            next_cursor=next_cursor,
+        ),
     )
 
 
@@ -19,6 +19,7 @@ from core.auth.utilities.decorators import check_perm
 from core.utils import (
     db_to_graphql_type_converter,
     get_requested_fields,
+    is_field_requested,
 )
 from core.graphql_base_model import (
     BaseGraphQLQueryMeta,
@@ -40,13 +41,28 @@ def resolve_configuration(
     if not meta:
         meta = BaseGraphQLQueryMetaInput()
     requested_fields = get_requested_fields(info, "SettingsConfigurationList")
-    configs, has_more, count = ConfigurationCrud.get_many_partial_with_pagination(
-        query.to_dict(), requested_fields, **meta.to_dict(), search_text=search_text
+    (
+        configs,
+        has_more,
+        count,
+        next_cursor,
+    ) = ConfigurationCrud.get_many_partial_with_pagination(
+        query.to_dict(),
+        requested_fields,
+        **meta.to_dict(),
+        search_text=search_text,
+        with_count=is_field_requested(info, "SettingsConfigurationList", "count"),
+        as_rows=True,
     )
 
     return SettingsConfigurationList(
         response=configs,
-        meta=BaseGraphQLQueryMeta(**meta.to_dict(), has_more=has_more, count=count),
+        meta=BaseGraphQLQueryMeta(
+            **meta.to_dict(),
+            has_more=has_more,
+            count=count,
+            next_cursor=next_cursor,
+        ),
     )
 
 
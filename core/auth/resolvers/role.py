@@ -3,8 +3,11 @@ from typing import Optional
 import strawberry
 from strawberry.types import Info
 
-from core.auth.crud.role import RoleCrud
+from core.auth.crud.role import AsyncRoleCrud, RoleCrud
 from core.auth.graphql_models.role import (
+    RoleBulkRead,
+    RoleBulkUpdate,
+    RoleBulkUpdateResponse,
     RoleCreate,
     RoleCreateResponse,
     RoleList,
@@ -22,6 +25,7 @@ from core.auth.utilities.decorators import check_perm
 from core.utils import (
     db_to_graphql_type_converter,
     get_requested_fields,
+    is_field_requested,
 )
 from core.graphql_base_model import (
     BaseGraphQLQueryMeta,
@@ -36,7 +40,7 @@ MUTATION_READ_OBJECT = RoleRead
 
 @graphql_exception_handler
 @check_perm(PermissionsEnum.ROLE_READ_VALUES)
-def resolve_roles(
+async def resolve_roles(
     info: Info,
     query: RoleQuery,
     meta: Optional[BaseGraphQLQueryMetaInput] = None,
@@ -45,12 +49,27 @@ def resolve_roles(
     if not meta:
         meta = BaseGraphQLQueryMetaInput()
     requested_fields = get_requested_fields(info, "RoleList")
-    roles, has_more, count = RoleCrud.get_many_partial_with_pagination(
-        query.to_dict(), requested_fields, **meta.to_dict(), search_text=search_text
+    (
+        roles,
+        has_more,
+        count,
+        next_cursor,
+    ) = await AsyncRoleCrud.get_many_partial_with_pagination(
+        query.to_dict(),
+        requested_fields,
+        **meta.to_dict(),
+        search_text=search_text,
+        with_count=is_field_requested(info, "RoleList", "count"),
+        as_rows=True,
     )
     return RoleList(
         response=roles,
-        meta=BaseGraphQLQueryMeta(**meta.to_dict(), has_more=has_more, count=count),
+        meta=BaseGraphQLQueryMeta(
+            **meta.to_dict(),
+            has_more=has_more,
+            count=count,
+            next_cursor=next_cursor,
+        ),
     )
 
 
@@ -83,24 +102,44 @@ def resolve_create_role(info: Info, role: RoleCreate) -> RoleCreateResponse:
 def resolve_update_role(
     info: Info, id: strawberry.ID, set: RoleUpdate
 ) -> RoleUpdateResponse:
-    update_fields = set.to_dict()
-    if "permissions" in update_fields:
-        update_fields["permissions"] = [
-            {
-                "value": perm_value,
-                "display_name": PERMISSION_VALUE_TO_DISPLAY_NAME[perm_value],
-            }
-            for perm_value in update_fields["permissions"]
-        ]
     return RoleCrud.update(
         {"id": id},
-        update_fields,
+        get_role_update_fields(set),
+        signal_kwargs={
+            "created_by": info.context.user,
+            **info.context.source_info,
+            "is_audit": True,
+        },
+    )
+
+
+@graphql_exception_handler
+@check_perm(PermissionsEnum.ROLE_UPDATE_VALUES)
+def resolve_update_roles(
+    info: Info, updates: list[RoleBulkUpdate]
+) -> RoleBulkUpdateResponse:
+    roles = RoleCrud.bulk_update(
+        {update.id: get_role_update_fields(update.set) for update in updates},
         signal_kwargs={
             "created_by": info.context.user,
             **info.context.source_info,
             "is_audit": True,
         },
     )
+    return RoleBulkRead(response=roles)
+
+
+def get_role_update_fields(role: RoleUpdate) -> dict:
+    update_fields = role.to_dict()
+    if "permissions" in update_fields:
+        update_fields["permissions"] = [
+            {
+                "value": perm_value,
+                "display_name": PERMISSION_VALUE_TO_DISPLAY_NAME[perm_value],
+            }
+            for perm_value in update_fields["permissions"]
+        ]
+    return update_fields
 
 
 @graphql_exception_handler
@@ -117,3 +156,17 @@ def resolve_delete_role(info: Info, id: strawberry.ID) -> DeleteResponse:
             },
         ),
     )
+
+
+@graphql_exception_handler
+@db_to_graphql_type_converter(MUTATION_READ_OBJECT)
+@check_perm(PermissionsEnum.ROLE_DELETE_VALUES)
+def resolve_restore_role(info: Info, id: strawberry.ID) -> RoleUpdateResponse:
+    return RoleCrud.restore(
+        id,
+        signal_kwargs={
+            "created_by": info.context.user,
+            **info.context.source_info,
+            "is_audit": True,
+        },
+    )
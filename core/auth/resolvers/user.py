@@ -5,7 +5,7 @@ from typing import Optional
 import strawberry
 from strawberry.types import Info
 from webauthn import generate_authentication_options, verify_authentication_response
-from webauthn.helpers import base64url_to_bytes
+from webauthn.helpers import base64url_to_bytes, bytes_to_base64url
 from webauthn.helpers.structs import (
     AuthenticationCredential,
     AuthenticatorAssertionResponse,
@@ -14,7 +14,7 @@ from webauthn.helpers.structs import (
     PublicKeyCredentialDescriptor as LibPublicKeyCredentialDescriptor,
 )
 
-from core.auth.crud.user import UserCrud
+from core.auth.crud.user import AsyncUserCrud, UserCrud
 from core.auth.graphql_models.user import (
     Login,
     LoginResponse,
@@ -22,6 +22,8 @@ from core.auth.graphql_models.user import (
     MeInfoResponse,
     TokenResponse,
     UpdateSelfUserResponse,
+    UserBulkCreateResponse,
+    UserBulkRead,
     UserCreate,
     UserCreateResponse,
     UserList,
@@ -44,6 +46,7 @@ from core.auth.models.permission import PermissionsEnum
 from core.auth.models.user import User
 from core.auth.utilities.auth_handler import AuthHandler
 from core.auth.utilities.decorators import check_perm
+from core.auth.utilities.session_store import SessionStore
 from core.auth.utilities.utilities import (
     check_digit_code_failed_attempts,
     generate_digit_code,
@@ -52,14 +55,16 @@ from core.auth.utilities.utilities import (
     generate_password,
     get_mail_template,
     get_register_mail_template,
-    get_user_id_by_one_time_token,
+    get_session_by_one_time_token,
     send_mail,
+    send_mails,
 )
 from core.config import settings
 from core.utils import (
     convert_to_graphql_type,
     db_to_graphql_type_converter,
     get_requested_fields,
+    is_field_requested,
 )
 from core.exception import (
     AuthenticationException,
@@ -82,7 +87,7 @@ from core.auth.enum import UserTypeEnum
 
 @graphql_exception_handler
 @check_perm(PermissionsEnum.USER_READ_VALUES)
-def resolve_users(
+async def resolve_users(
     info: Info,
     query: UserQuery,
     meta: Optional[BaseGraphQLQueryMetaInput] = None,
@@ -91,19 +96,33 @@ def resolve_users(
     if not meta:
         meta = BaseGraphQLQueryMetaInput()
     requested_fields = get_requested_fields(info, "UserList")
-    users, has_more, count = UserCrud.get_many_partial_with_pagination(
-        query.to_dict(), requested_fields, **meta.to_dict(), search_text=search_text
+    (
+        users,
+        has_more,
+        count,
+        next_cursor,
+    ) = await AsyncUserCrud.get_many_partial_with_pagination(
+        query.to_dict(),
+        requested_fields,
+        **meta.to_dict(),
+        search_text=search_text,
+        with_count=is_field_requested(info, "UserList", "count"),
+        as_rows=True,
     )
     return UserList(
         response=users,
-        meta=BaseGraphQLQueryMeta(**meta.to_dict(), has_more=has_more, count=count),
+        meta=BaseGraphQLQueryMeta(
+            **meta.to_dict(),
+            has_more=has_more,
+            count=count,
+            next_cursor=next_cursor,
+        ),
     )
 
 
 @graphql_exception_handler
 def resolve_me_info(info: Info) -> MeInfoResponse:
-    user = UserCrud.get(id=info.context.user["id"])
-    return MeInfo(response=user)
+    return MeInfo(response=info.context.user)
 
 
 @graphql_exception_handler
@@ -135,6 +154,43 @@ def resolve_create_user(info: Info, user: UserCreate) -> UserCreateResponse:
     return new_user
 
 
+@graphql_exception_handler
+@check_perm(PermissionsEnum.USER_CREATE_VALUES)
+def resolve_create_users(info: Info, users: list[UserCreate]) -> UserBulkCreateResponse:
+    expiration_date = datetime.now(timezone.utc) + timedelta(days=7)
+    pipeline = Redis.pipeline(transaction=False)
+    mails = []
+    for user in users:
+        token = generate_invite_token()
+        token_value = {
+            "email": user.email,
+            "expiration_date": expiration_date.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        pipeline.set(token, json.dumps(token_value), timedelta(days=7))
+        user.password = generate_password()
+        mails.append(
+            {
+                "to_email": user.email,
+                "subject": "App Invite",
+                "body": get_register_mail_template(
+                    f"{settings.ALLOW_HOST}/reset-password/{token}"
+                ),
+            }
+        )
+    new_users = UserCrud.bulk_create(
+        [user.to_dict() for user in users],
+        signal_kwargs={
+            "created_by": info.context.user,
+            **info.context.source_info,
+            "is_audit": True,
+        },
+    )
+    pipeline.execute()
+    send_mails(mails)
+
+    return UserBulkRead(response=new_users)
+
+
 @graphql_exception_handler
 @db_to_graphql_type_converter(UserRead)
 @check_perm(PermissionsEnum.USER_UPDATE_VALUES)
@@ -164,17 +220,24 @@ def resolve_update_self_user(info: Info, set: UserUpdate) -> UpdateSelfUserRespo
             "is_audit": True,
         },
     )
+    session_id = info.context.token_payload.get("sid")
     user.access_token = AuthHandler.encode_token(
-        email=user.email, scope="access_token", ttl={"days": 0, "hours": 2}
+        email=user.email,
+        scope="access_token",
+        ttl={"days": 0, "hours": 2},
+        session_id=session_id,
     )
     user.refresh_token = AuthHandler.encode_token(
-        email=user.email, scope="refresh_token", ttl={"days": 0, "hours": 20}
-    )
-    Redis.set(
-        f"{user.email}_refresh_token",
-        user.refresh_token,
-        exp=timedelta(days=0, hours=20),
+        email=user.email,
+        scope="refresh_token",
+        ttl={"days": 0, "hours": 20},
+        session_id=session_id,
     )
+    if user.email != info.context.user.email:
+        SessionStore.delete(info.context.user.email)
+    SessionStore.write(user.email).set_tokens(
+        session_id, user.access_token, user.refresh_token
+    ).execute()
     return user
 
 
@@ -194,48 +257,81 @@ def resolve_delete_user(info: Info, id: strawberry.ID) -> DeleteResponse:
     )
 
 
+@graphql_exception_handler
+@check_perm(PermissionsEnum.USER_DELETE_VALUES)
+def resolve_delete_users(info: Info, ids: list[strawberry.ID]) -> DeleteResponse:
+    UserCrud.bulk_soft_delete(
+        ids,
+        signal_kwargs={
+            "created_by": info.context.user,
+            **info.context.source_info,
+            "is_audit": True,
+        },
+    )
+    return DeleteOutput(message="Deleted successfully", success=True)
+
+
+@graphql_exception_handler
+@db_to_graphql_type_converter(UserRead)
+@check_perm(PermissionsEnum.USER_DELETE_VALUES)
+def resolve_restore_user(info: Info, id: strawberry.ID) -> UserUpdateResponse:
+    return UserCrud.restore(
+        id,
+        signal_kwargs={
+            "created_by": info.context.user,
+            **info.context.source_info,
+            "is_audit": True,
+        },
+    )
+
+
 @graphql_exception_handler
 def resolve_login(info: Info, query: UserLoginQuery) -> LoginResponse:
     auth_data = UserCrud.get(email=query.email)
-    if not auth_data or not AuthHandler.verify_password(
-        query.password, auth_data["password"]
-    ):
-        if not AuthHandler.verify_password(query.password, auth_data["password"]):
-            non_db_signal.send(
-                User,
-                document=auth_data,
-                **{**info.context.source_info, "is_audit": True, "exception": "login_failed"},
-            )
+    if not AuthHandler.verify_password(query.password, auth_data["password"]):
+        non_db_signal.send(
+            User,
+            document=auth_data,
+            **{**info.context.source_info, "is_audit": True, "exception": "login_failed"},
+        )
         raise AuthenticationException()
+    session_id = SessionStore.new_session_id()
     if auth_data.user_type == UserTypeEnum.API:
         access_token = AuthHandler.encode_token(
-        query.email, scope="access_token", ttl={"days": 365, "hours": 2})
-        
+            query.email,
+            scope="access_token",
+            ttl={"days": 365, "hours": 2},
+            session_id=session_id,
+        )
         refresh_token = AuthHandler.encode_token(
-            query.email, scope="refresh_token", ttl={"days": 365, "hours": 20}
+            query.email,
+            scope="refresh_token",
+            ttl={"days": 365, "hours": 20},
+            session_id=session_id,
         )
     else:
         access_token = AuthHandler.encode_token(
-            query.email, scope="access_token", ttl={"days": 0, "hours": 2}
+            query.email,
+            scope="access_token",
+            ttl={"days": 0, "hours": 2},
+            session_id=session_id,
         )
         refresh_token = AuthHandler.encode_token(
-            query.email, scope="refresh_token", ttl={"days": 0, "hours": 20}
+            query.email,
+            scope="refresh_token",
+            ttl={"days": 0, "hours": 20},
+            session_id=session_id,
         )
-    Redis.set(
-        f"{auth_data.email}_access_token",
-        access_token,
-        exp=timedelta(days=0, hours=2),
-    )
-    Redis.set(
-        f"{auth_data.email}_refresh_token",
-        refresh_token,
-        exp=timedelta(days=0, hours=20),
+    session = SessionStore.write(auth_data.email).set_tokens(
+        session_id, access_token, refresh_token
     )
 
     non_db_signal.send(
         User, document=auth_data, **{**info.context.source_info, "is_audit": True}
     )
     if auth_data.is_two_factor_auth_enabled is False:
+        session.execute()
+        AuthHandler.revoke_cached_tokens(auth_data.email)
         return Login(
             access_token=access_token, refresh_token=refresh_token, user=auth_data
         )
@@ -255,24 +351,31 @@ def resolve_login(info: Info, query: UserLoginQuery) -> LoginResponse:
             timeout=settings.TIMEOUT,
         )
 
-        Redis.set(
-            f"webauthn_challenge_{auth_data.email}",
-            authentication_options.challenge,
-            exp=int(settings.TIMEOUT),
-        )
+        session.set(
+            SessionStore.session_field(session_id, "webauthn_challenge"),
+            bytes_to_base64url(authentication_options.challenge),
+            int(settings.TIMEOUT),
+        ).execute()
+        AuthHandler.revoke_cached_tokens(auth_data.email)
 
-        return convert_to_graphql_type(
+        options = convert_to_graphql_type(
             authentication_options, PublicKeyCredentialRequestOptions
         )
+        options.session_id = session_id
+        return options
 
     digit_code = generate_digit_code()
 
-    Redis.set(
-        f"{auth_data.email}_digit_code",
+    session.set(
+        SessionStore.session_field(session_id, "digit_code"),
         digit_code,
-        exp=timedelta(days=0, hours=0, minutes=3),
-    )
-    Redis.set(f"{auth_data.email}_failed_attempts", "0")
+        SessionStore.digit_code_ttl,
+    ).set(
+        SessionStore.session_field(session_id, "failed_attempts"),
+        0,
+        SessionStore.digit_code_ttl,
+    ).execute()
+    AuthHandler.revoke_cached_tokens(auth_data.email)
 
     mail_template = get_mail_template(
         firstname=auth_data.account.firstname, digit_code=digit_code
@@ -284,27 +387,31 @@ def resolve_login(info: Info, query: UserLoginQuery) -> LoginResponse:
         to_email=auth_data.email,
     )
 
-    return Login(mfa_type="one-time-password", user=auth_data)
+    return Login(mfa_type="one-time-password", user=auth_data, session_id=session_id)
 
 
 @graphql_exception_handler
 def resolve_refresh_token(info: Info, refresh_token: str) -> UserLoginResponse:
-    email = AuthHandler.decode_token(refresh_token, "refresh_token")
-    store_refresh_token = Redis.get(f"{email}_refresh_token")
+    payload = AuthHandler.decode_token_payload(refresh_token, "refresh_token")
+    email, session_id = payload["sub"], payload.get("sid")
+    session = SessionStore.get(email)
 
-    if store_refresh_token != refresh_token:
+    if session.get(SessionStore.session_field(session_id, "refresh_token")) != (
+        refresh_token
+    ):
         raise InvalidTokenError()
 
     access_token = AuthHandler.refresh_token(refresh_token)
     refresh_token = AuthHandler.encode_token(
-        email, scope="refresh_token", ttl={"days": 0, "hours": 20}
+        email,
+        scope="refresh_token",
+        ttl={"days": 0, "hours": 20},
+        session_id=session_id,
     )
 
-    Redis.set(
-        f"{email}_refresh_token",
-        refresh_token,
-        exp=timedelta(days=0, hours=20),
-    )
+    SessionStore.write(email).set_tokens(
+        session_id, access_token, refresh_token
+    ).execute()
 
     return TokenResponse(access_token=access_token, refresh_token=refresh_token)
 
@@ -313,16 +420,24 @@ def resolve_refresh_token(info: Info, refresh_token: str) -> UserLoginResponse:
 def resolve_verify_auth(info: Info, input: AuthenticationInput) -> UserLoginResponse:
     user = UserCrud.get(email=input.email)
 
+    session_id = input.session_id
+    session = SessionStore.get(input.email)
+
     if input.digit_code:
-        digit_code_in_redis = Redis.get(f"{input.email}_digit_code")
+        digit_code_field = SessionStore.session_field(session_id, "digit_code")
+        digit_code_in_redis = session.get(digit_code_field)
         if digit_code_in_redis is None or input.digit_code != digit_code_in_redis:
-            check_digit_code_failed_attempts(input.email)
+            check_digit_code_failed_attempts(input.email, session_id)
             raise DigitCodeError()
+        SessionStore.write(input.email).delete(
+            digit_code_field, SessionStore.session_field(session_id, "failed_attempts")
+        ).execute()
 
     elif input.credential:
         existing_credential = user.public_key_credential
-        expected_challenge = Redis.get_raw(f"webauthn_challenge_{input.email}")
-        Redis.delete(f"webauthn_challenge_{input.email}")
+        challenge_field = SessionStore.session_field(session_id, "webauthn_challenge")
+        expected_challenge = session.get(challenge_field)
+        SessionStore.write(input.email).delete(challenge_field).execute()
 
         response = input.credential.response
 
@@ -338,7 +453,8 @@ def resolve_verify_auth(info: Info, input: AuthenticationInput) -> UserLoginResp
                 ),
                 type=input.credential.type,
             ),
-            expected_challenge=expected_challenge,
+            expected_challenge=expected_challenge
+            and base64url_to_bytes(expected_challenge),
             expected_rp_id=settings.RP_ID,
             expected_origin=settings.EXPECTED_ORIGIN,
             credential_public_key=base64url_to_bytes(existing_credential.public_key),
@@ -348,18 +464,20 @@ def resolve_verify_auth(info: Info, input: AuthenticationInput) -> UserLoginResp
     else:
         raise AuthenticationException()
 
-    refresh_token = Redis.get(f"{input.email}_refresh_token")
-    access_token = Redis.get(f"{input.email}_access_token")
     return TokenResponse(
-        access_token=access_token,
-        refresh_token=refresh_token,
+        access_token=session.get(
+            SessionStore.session_field(session_id, "access_token")
+        ),
+        refresh_token=session.get(
+            SessionStore.session_field(session_id, "refresh_token")
+        ),
     )
 
 
 @graphql_exception_handler
 def resolve_generate_one_time_token(info: Info) -> UserOneTimeTokenResponse:
     user_id = str(info.context.user["id"])
-    token = generate_one_time_token(user_id)
+    token = generate_one_time_token(user_id, info.context.token_payload.get("sid"))
     return UserOneTimeToken(token=token)
 
 
@@ -367,14 +485,17 @@ def resolve_generate_one_time_token(info: Info) -> UserOneTimeTokenResponse:
 def resolve_get_token_by_one_time_token(
     info: Info, one_time_token: str
 ) -> UserLoginResponse:
-    user_id = get_user_id_by_one_time_token(one_time_token)
+    user_id, session_id = get_session_by_one_time_token(one_time_token)
     email = UserCrud.get_partial({"id": user_id}, fields=["email"])["email"]
-    refresh_token = Redis.get(f"{email}_refresh_token")
-    access_token = Redis.get(f"{email}_access_token")
+    session = SessionStore.get(email)
 
     return TokenResponse(
-        access_token=access_token,
-        refresh_token=refresh_token,
+        access_token=session.get(
+            SessionStore.session_field(session_id, "access_token")
+        ),
+        refresh_token=session.get(
+            SessionStore.session_field(session_id, "refresh_token")
+        ),
     )
 
 
@@ -30,11 +30,11 @@ from core.auth.graphql_models.webauhtn import (
 from core.auth.models.permission import PermissionsEnum
 from core.auth.models.user import PublicKeyCredential
 from core.auth.utilities.decorators import check_perm
+from core.auth.utilities.session_store import SessionStore
 from core.config import settings
 from core.utils import convert_to_graphql_type
 from core.exception import AuthenticationException
 from core.graphql_decorator import graphql_exception_handler
-from core.redis import Redis
 
 
 @graphql_exception_handler
@@ -61,11 +61,13 @@ def resolve_webauthn_generate_registration_options(
         timeout=int(settings.TIMEOUT),
     )
 
-    Redis.set(
-        f"webauthn_challenge_{user.email}",
-        registration_options.challenge,
-        exp=int(settings.TIMEOUT),
-    )
+    SessionStore.write(user.email).set(
+        SessionStore.session_field(
+            info.context.token_payload.get("sid"), "webauthn_challenge"
+        ),
+        bytes_to_base64url(registration_options.challenge),
+        int(settings.TIMEOUT),
+    ).execute()
 
     return convert_to_graphql_type(
         registration_options, PublicKeyCredentialCreationOptions
@@ -79,8 +81,11 @@ def resolve_webauthn_verify_registration_response(
 ) -> WebAuthnVerifyRegistrationResponse:
     user = info.context.user
 
-    expected_challenge = Redis.get_raw(f"webauthn_challenge_{user.email}")
-    Redis.delete(f"webauthn_challenge_{user.email}")
+    challenge_field = SessionStore.session_field(
+        info.context.token_payload.get("sid"), "webauthn_challenge"
+    )
+    expected_challenge = SessionStore.get(user.email).get(challenge_field)
+    SessionStore.write(user.email).delete(challenge_field).execute()
 
     credential = input.credential
     response = credential.response
@@ -97,7 +102,8 @@ def resolve_webauthn_verify_registration_response(
             transports=credential.transports,
             type=credential.type,
         ),
-        expected_challenge=expected_challenge,
+        expected_challenge=expected_challenge
+        and base64url_to_bytes(expected_challenge),
         expected_rp_id=settings.RP_ID,
         expected_origin=settings.EXPECTED_ORIGIN,
         require_user_verification=True,
@@ -154,12 +160,14 @@ def resolve_webauthn_generate_authentication_options(
         timeout=settings.TIMEOUT,
     )
 
-    Redis.set(
-        f"webauthn_challenge_{input.email}",
-        authentication_options.challenge,
-        exp=int(settings.TIMEOUT),
-    )
+    SessionStore.write(input.email).set(
+        SessionStore.session_field(input.session_id, "webauthn_challenge"),
+        bytes_to_base64url(authentication_options.challenge),
+        int(settings.TIMEOUT),
+    ).execute()
 
-    return convert_to_graphql_type(
+    options = convert_to_graphql_type(
         authentication_options, PublicKeyCredentialRequestOptions
     )
+    options.session_id = input.session_id
+    return options
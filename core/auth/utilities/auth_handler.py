@@ -2,8 +2,13 @@ from datetime import datetime, timedelta, timezone
 
 import jwt
 from fastapi.security import HTTPBearer
-from passlib.context import CryptContext
 
+from core.auth.utilities.password_pool import (
+    PasswordHashPool,
+    hash_password,
+    verify_password,
+)
+from core.auth.utilities.token_cache import VerifiedTokenCache
 from core.config import settings
 from core.exception import (
     EncodeTokenError,
@@ -15,19 +20,23 @@ from core.exception import (
 
 class AuthHandler:
     security = HTTPBearer()
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
     secret = settings.SECRET
+    token_cache = VerifiedTokenCache(maxsize=settings.TOKEN_CACHE_SIZE)
 
     @classmethod
     def get_password_hash(cls, password):
-        return cls.pwd_context.hash(password)
+        return PasswordHashPool.run(hash_password, password)
+
+    @classmethod
+    def get_password_hashes(cls, passwords: list[str]) -> list[str]:
+        return PasswordHashPool.map(hash_password, passwords)
 
     @classmethod
     def verify_password(cls, plain_password, hashed_password):
-        return cls.pwd_context.verify(plain_password, hashed_password)
+        return PasswordHashPool.run(verify_password, plain_password, hashed_password)
 
     @classmethod
-    def encode_token(cls, email, scope, ttl):
+    def encode_token(cls, email, scope, ttl, session_id=None):
         exp = datetime.now(timezone.utc) + timedelta(**ttl)
         try:
             payload = {
@@ -36,23 +45,42 @@ class AuthHandler:
                 "scope": scope,
                 "sub": email,
             }
+            if session_id:
+                payload["sid"] = session_id
             return jwt.encode(payload, cls.secret, algorithm="HS256")
         except:
             raise EncodeTokenError()
 
     @classmethod
     def decode_token(cls, token, scope):
-        try:
-            payload = jwt.decode(token, cls.secret, algorithms=["HS256"])
-            if payload["scope"] != scope:
-                raise InvalidScopeTokenError()
-            return payload["sub"]
-        except jwt.ExpiredSignatureError:
-            raise ExpiredSignatureError()
-        except jwt.InvalidTokenError:
-            raise InvalidTokenError()
+        return cls.decode_token_payload(token, scope)["sub"]
+
+    @classmethod
+    def decode_token_payload(cls, token, scope) -> dict:
+        payload = token and cls.token_cache.get(token)
+        if not payload:
+            try:
+                payload = jwt.decode(token, cls.secret, algorithms=["HS256"])
+            except jwt.ExpiredSignatureError:
+                raise ExpiredSignatureError()
+            except jwt.InvalidTokenError:
+                raise InvalidTokenError()
+            cls.token_cache.set(token, payload)
+
+        if payload["scope"] != scope:
+            raise InvalidScopeTokenError()
+        return payload
+
+    @classmethod
+    def revoke_cached_tokens(cls, email):
+        cls.token_cache.revoke(email)
 
     @classmethod
     def refresh_token(cls, refresh_token):
-        email = cls.decode_token(refresh_token, "refresh_token")
-        return cls.encode_token(email, "access_token", {"days": 0, "hours": 2})
+        payload = cls.decode_token_payload(refresh_token, "refresh_token")
+        return cls.encode_token(
+            payload["sub"],
+            "access_token",
+            {"days": 0, "hours": 2},
+            session_id=payload.get("sid"),
+        )
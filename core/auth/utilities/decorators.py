@@ -1,14 +1,20 @@
 import asyncio
 from functools import wraps
 
+from fastapi.concurrency import run_in_threadpool
+
+from core.auth.utilities.permission_mask import RolePermissionMask
 from core.exception import UserNotPermissions
 
+def has_permission(user, permission) -> bool:
+    return user.is_superuser or RolePermissionMask.has_permission(
+        user.role, permission
+    )
+
+
 def check_permission_block(permission, **kwargs):
     user_object = kwargs["info"].context.user
-    if user_object.is_superuser or permission.value in [
-        {"value": i.value, "display_name": i.display_name}
-        for i in user_object.role.permissions
-    ]:
+    if has_permission(user_object, permission):
         return True
     else:
         raise UserNotPermissions(user_object.email)
@@ -17,7 +23,8 @@ def check_perm(permission):
         if asyncio.iscoroutinefunction(func):
             @wraps(func)
             async def wrapper(*args, **kwargs):
-                if check_permission_block(permission, **kwargs):
+                # resolving the principal hits Redis and Mongo synchronously
+                if await run_in_threadpool(check_permission_block, permission, **kwargs):
                     return (await func(*args, **kwargs))
         else:
             @wraps(func)
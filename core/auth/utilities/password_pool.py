@@ -0,0 +1,81 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from passlib.context import CryptContext
+
+from core.config import settings
+from core.exception import PasswordHashingBusyError
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def hash_password(password):
+    return pwd_context.hash(password)
+
+
+def verify_password(plain_password, hashed_password):
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+class PasswordHashPool:
+    _executor: ProcessPoolExecutor | None = None
+    _executor_lock = threading.Lock()
+    # running plus queued jobs, anything above is rejected instead of waiting
+    _slots = threading.BoundedSemaphore(
+        settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_QUEUE_SIZE
+    )
+
+    @classmethod
+    def run(cls, func, *args):
+        [result] = cls._run_chunk(func, [args])
+        return result
+
+    @classmethod
+    def map(cls, func, *iterables) -> list:
+        jobs = list(zip(*iterables))
+        results = []
+        # chunks never exceed the worker count so queued logins interleave
+        for index in range(0, len(jobs), settings.PASSWORD_HASH_WORKERS):
+            results.extend(
+                cls._run_chunk(
+                    func, jobs[index : index + settings.PASSWORD_HASH_WORKERS]
+                )
+            )
+        return results
+
+    @classmethod
+    def _run_chunk(cls, func, jobs: list[tuple]) -> list:
+        acquired = 0
+        try:
+            for _ in jobs:
+                if not cls._slots.acquire(blocking=False):
+                    raise PasswordHashingBusyError()
+                acquired += 1
+            executor = cls._get_executor()
+            futures = [executor.submit(func, *args) for args in jobs]
+            return [future.result() for future in futures]
+        except BrokenProcessPool:
+            cls._reset_executor()
+            raise
+        finally:
+            for _ in range(acquired):
+                cls._slots.release()
+
+    @classmethod
+    def _get_executor(cls) -> ProcessPoolExecutor:
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ProcessPoolExecutor(
+                    max_workers=settings.PASSWORD_HASH_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return cls._executor
+
+    @classmethod
+    def _reset_executor(cls):
+        with cls._executor_lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=False, cancel_futures=True)
+                cls._executor = None
@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from core.auth.models.permission import PERMISSION_VALUE_TO_BIT, PermissionsEnum
+from core.auth.models.role import Role
+
+
+class RolePermissionMask:
+    _masks: dict[str, tuple[datetime, int]] = {}
+
+    @classmethod
+    def has_permission(cls, role: Role | None, permission: PermissionsEnum) -> bool:
+        if role is None:
+            return False
+        return bool(cls.get(role) & PERMISSION_VALUE_TO_BIT[permission.value["value"]])
+
+    @classmethod
+    def get(cls, role: Role) -> int:
+        entry = cls._masks.get(str(role.id))
+        if entry and entry[0] == role.updated_at:
+            return entry[1]
+        return cls.compile(role)
+
+    @classmethod
+    def compile(cls, role: Role) -> int:
+        mask = 0
+        for permission in role.permissions:
+            mask |= PERMISSION_VALUE_TO_BIT.get(permission.value, 0)
+        cls._masks[str(role.id)] = (role.updated_at, mask)
+        return mask
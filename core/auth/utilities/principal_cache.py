@@ -0,0 +1,111 @@
+import time
+
+from bson import json_util
+from mongoengine import Document
+
+from core.auth.crud.user import UserCrud
+from core.auth.models.account import Account
+from core.auth.models.role import Role
+from core.auth.models.user import User
+from core.config import settings
+from core.redis import Redis
+
+
+class PrincipalCache:
+    ttl = settings.PRINCIPAL_CACHE_TTL
+    excluded_user_fields = {"password"}
+
+    @classmethod
+    def get(cls, email: str, issued_at: int, expires_at: int) -> User:
+        key = cls._get_key(email, issued_at)
+        if snapshot := Redis.get(key):
+            return cls._load(snapshot)
+
+        user = UserCrud.get(email=email)
+        exp = min(cls.ttl, int(expires_at - time.time()))
+        if exp > 0:
+            cls._store(key, user, exp)
+        return user
+
+    @classmethod
+    def invalidate_user(cls, sender, document: Document, **kwargs):
+        cls._invalidate(cls._get_tag_key("user", document.email))
+
+    @classmethod
+    def invalidate_role(cls, sender, document: Document, **kwargs):
+        cls._invalidate(cls._get_tag_key("role", document.id))
+
+    @classmethod
+    def invalidate_account(cls, sender, document: Document, **kwargs):
+        cls._invalidate(cls._get_tag_key("account", document.id))
+
+    @classmethod
+    def invalidate_many(
+        cls,
+        sender,
+        documents: list[Document] | None = None,
+        changes: list[tuple[Document, dict]] | None = None,
+        **kwargs,
+    ):
+        if changes is not None:
+            documents = [document for document, _ in changes]
+        tag_keys = [cls._get_document_tag_key(document) for document in documents]
+        if not tag_keys:
+            return
+        pipeline = Redis.pipeline(transaction=False)
+        for tag_key in tag_keys:
+            pipeline.get_set_members(tag_key)
+        keys = set().union(*pipeline.execute())
+        Redis.delete(*keys, *tag_keys)
+
+    @classmethod
+    def _invalidate(cls, tag_key: str):
+        Redis.delete(*Redis.get_set_members(tag_key), tag_key)
+
+    @classmethod
+    def _store(cls, key: str, user: User, exp: int):
+        user_son = user.to_mongo().to_dict()
+        for field in cls.excluded_user_fields:
+            user_son.pop(field, None)
+
+        role, account = user.role, user.account
+        snapshot = {
+            "user": user_son,
+            "role": role and role.to_mongo().to_dict(),
+            "account": account and account.to_mongo().to_dict(),
+        }
+        pipeline = Redis.pipeline().set(key, json_util.dumps(snapshot), exp=exp)
+        pipeline.add_to_set(cls._get_tag_key("user", user.email), key, exp=cls.ttl)
+        if role:
+            pipeline.add_to_set(cls._get_tag_key("role", role.id), key, exp=cls.ttl)
+        if account:
+            pipeline.add_to_set(
+                cls._get_tag_key("account", account.id), key, exp=cls.ttl
+            )
+        pipeline.execute()
+
+    @staticmethod
+    def _load(snapshot: str) -> User:
+        snapshot = json_util.loads(snapshot)
+        user = User._from_son(snapshot["user"])
+        if snapshot["role"]:
+            user._data["role"] = Role._from_son(snapshot["role"])
+        if snapshot["account"]:
+            user._data["account"] = Account._from_son(snapshot["account"])
+        return user
+
+    @staticmethod
+    def _get_key(email: str, issued_at: int) -> str:
+        return f"principal_{email}_{issued_at}"
+
+    @staticmethod
+    def _get_tag_key(tag: str, value) -> str:
+        return f"principal_tag_{tag}_{value}"
+
+    @classmethod
+    def _get_document_tag_key(cls, document: Document) -> str:
+        if isinstance(document, User):
+            return cls._get_tag_key("user", document.email)
+        if isinstance(document, Role):
+            return cls._get_tag_key("role", document.id)
+        return cls._get_tag_key("account", document.id)
@@ -0,0 +1,175 @@
+import secrets
+import time
+from datetime import timedelta
+
+from core.redis import Redis
+
+WRITE_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local results = {}
+for i = 2, #ARGV, 4 do
+    local op, field, value, ttl = ARGV[i], ARGV[i + 1], ARGV[i + 2], ARGV[i + 3]
+    local exp_field = "exp:" .. field
+    if op == "del" then
+        redis.call("HDEL", key, field, exp_field)
+    else
+        if op == "incr" then
+            local exp = tonumber(redis.call("HGET", key, exp_field))
+            if exp and exp <= now then
+                redis.call("HDEL", key, field)
+            end
+            table.insert(results, redis.call("HINCRBY", key, field, value))
+        else
+            redis.call("HSET", key, field, value)
+        end
+        redis.call("HSET", key, exp_field, now + tonumber(ttl))
+    end
+end
+
+local max_exp = 0
+local fields = redis.call("HGETALL", key)
+for i = 1, #fields, 2 do
+    local name = fields[i]
+    if string.sub(name, 1, 4) == "exp:" then
+        local exp = tonumber(fields[i + 1])
+        if exp <= now then
+            redis.call("HDEL", key, name, string.sub(name, 5))
+        elseif exp > max_exp then
+            max_exp = exp
+        end
+    end
+end
+if max_exp > 0 then
+    redis.call("PEXPIREAT", key, max_exp)
+else
+    redis.call("DEL", key)
+end
+return results
+"""
+
+LEGACY_KEY_PATTERNS = (
+    "*_access_token",
+    "*_refresh_token",
+    "*_digit_code",
+    "*_failed_attempts",
+    "webauthn_challenge_*",
+)
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _to_ms(ttl: timedelta | int) -> int:
+    if isinstance(ttl, timedelta):
+        return int(ttl.total_seconds() * 1000)
+    return int(ttl) * 1000
+
+
+class SessionWrite:
+    def __init__(self, email: str):
+        self.email = email
+        self._args = []
+
+    def set(self, field: str, value, ttl: timedelta | int):
+        self._args.extend(("set", field, value, _to_ms(ttl)))
+        return self
+
+    def incr(self, field: str, amount: int, ttl: timedelta | int):
+        self._args.extend(("incr", field, amount, _to_ms(ttl)))
+        return self
+
+    def delete(self, *fields: str):
+        for field in fields:
+            self._args.extend(("del", field, "", 0))
+        return self
+
+    def set_tokens(self, session_id: str, access_token: str, refresh_token: str):
+        return self.set(
+            SessionStore.session_field(session_id, "access_token"),
+            access_token,
+            SessionStore.access_token_ttl,
+        ).set(
+            SessionStore.session_field(session_id, "refresh_token"),
+            refresh_token,
+            SessionStore.refresh_token_ttl,
+        )
+
+    def execute(self) -> list[int]:
+        args, self._args = self._args, []
+        return SessionStore.get_script()(
+            keys=[SessionStore.get_key(self.email)], args=[_now_ms(), *args]
+        )
+
+
+class SessionStore:
+    prefix = "session"
+    access_token_ttl = timedelta(hours=2)
+    refresh_token_ttl = timedelta(hours=20)
+    digit_code_ttl = timedelta(minutes=3)
+    _script = None
+
+    @classmethod
+    def get_key(cls, email: str) -> str:
+        return f"{cls.prefix}:{email}"
+
+    @classmethod
+    def get_script(cls):
+        if cls._script is None:
+            cls._script = Redis.register_script(WRITE_SCRIPT)
+        return cls._script
+
+    @staticmethod
+    def session_field(session_id: str | None, scope: str) -> str:
+        return f"{session_id}:{scope}"
+
+    @staticmethod
+    def new_session_id() -> str:
+        return secrets.token_urlsafe(12)
+
+    @classmethod
+    def get(cls, email: str) -> dict[str, str]:
+        fields = Redis.get_hash(cls.get_key(email))
+        now = _now_ms()
+        return {
+            field: value
+            for field, value in fields.items()
+            if not field.startswith("exp:") and int(fields.get(f"exp:{field}", 0)) > now
+        }
+
+    @classmethod
+    def write(cls, email: str) -> SessionWrite:
+        return SessionWrite(email)
+
+    @classmethod
+    def delete(cls, email: str):
+        Redis.delete(cls.get_key(email))
+
+    @classmethod
+    def memory_report(cls) -> dict:
+        report = {
+            "sessions": 0,
+            "fields": 0,
+            "bytes": 0,
+            "legacy_keys": 0,
+            "legacy_bytes": 0,
+        }
+        for key in Redis.scan_keys(f"{cls.prefix}:*"):
+            report["sessions"] += 1
+            report["fields"] += Redis.hash_length(key) // 2
+            report["bytes"] += Redis.memory_usage(key)
+        for pattern in LEGACY_KEY_PATTERNS:
+            for key in Redis.scan_keys(pattern):
+                report["legacy_keys"] += 1
+                report["legacy_bytes"] += Redis.memory_usage(key)
+        return report
+
+    @classmethod
+    def purge_legacy_keys(cls) -> int:
+        purged = 0
+        for pattern in LEGACY_KEY_PATTERNS:
+            keys = list(Redis.scan_keys(pattern))
+            Redis.delete(*keys)
+            purged += len(keys)
+        return purged
@@ -0,0 +1,50 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+
+class VerifiedTokenCache:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._subjects: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> dict | None:
+        digest = self._get_digest(token)
+        with self._lock:
+            payload = self._entries.get(digest)
+            if payload is None:
+                return None
+            if payload["exp"] <= time.time():
+                self._evict(digest)
+                return None
+            self._entries.move_to_end(digest)
+            return payload
+
+    def set(self, token: str, payload: dict):
+        digest = self._get_digest(token)
+        with self._lock:
+            self._entries[digest] = payload
+            self._entries.move_to_end(digest)
+            self._subjects.setdefault(payload["sub"], set()).add(digest)
+            while len(self._entries) > self.maxsize:
+                self._evict(next(iter(self._entries)))
+
+    def revoke(self, subject: str):
+        with self._lock:
+            for digest in self._subjects.pop(subject, set()):
+                self._entries.pop(digest, None)
+
+    def _evict(self, digest: str):
+        payload = self._entries.pop(digest)
+        digests = self._subjects.get(payload["sub"])
+        if digests is not None:
+            digests.discard(digest)
+            if not digests:
+                del self._subjects[payload["sub"]]
+
+    @staticmethod
+    def _get_digest(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
@@ -2,43 +2,41 @@ import hashlib
 import random
 import re
 import secrets
-import smtplib
-import ssl
 import string
 from datetime import timedelta
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
 
 import pyotp
 from PIL import Image
 
-from core.auth.crud.configuration import ConfigurationCrud
 from core.auth.enum import NotStrongPasswordErrorMessage
-from core.exception import (
-    InvalidOneTimeTokenError,
-    OTPFailedAttemptsError,
-    SendMailException,
-)
+from core.auth.utilities.session_store import SessionStore
+from core.celery_client import client
+from core.config import settings
+from core.exception import InvalidOneTimeTokenError, OTPFailedAttemptsError
+from core.functions import initialize_logger
+from core.mail.crud.mail import MailOutboxCrud
 from core.redis import Redis
 
+logger = initialize_logger()
 
-def generate_one_time_token(user_id: str, key: str | None = None):
+
+def generate_one_time_token(user_id: str, session_id: str, key: str | None = None):
     if key is None:
         key = pyotp.random_base32()
     key_hash = hashlib.sha256(key.encode()).hexdigest()
     if Redis.exists(key):
-        return generate_one_time_token(user_id, key_hash)
+        return generate_one_time_token(user_id, session_id, key_hash)
     else:
-        Redis.set(key_hash, user_id, exp=timedelta(minutes=10))
+        Redis.set(key_hash, f"{user_id}:{session_id}", exp=timedelta(minutes=10))
         return key_hash
 
 
-def get_user_id_by_one_time_token(one_time_token: str):
-    user_id = Redis.get(one_time_token)
-    Redis.delete(one_time_token)
-    if user_id is None:
+def get_session_by_one_time_token(one_time_token: str) -> tuple[str, str]:
+    value, _ = Redis.pipeline().get(one_time_token).delete(one_time_token).execute()
+    if value is None:
         raise InvalidOneTimeTokenError()
-    return user_id
+    user_id, session_id = value.split(":", 1)
+    return user_id, session_id
 
 
 def generate_digit_code():
@@ -47,43 +45,41 @@ def generate_digit_code():
     return totp.now()
 
 
-def check_digit_code_failed_attempts(email):
-    failed_attempts = int(Redis.get(f"{email}_failed_attempts"))
-    if failed_attempts >= 2:
-        Redis.delete(f"{email}_digit_code")
-        raise OTPFailedAttemptsError()
-
-    failed_attempts += 1
-    Redis.set(
-        f"{email}_failed_attempts",
-        f"{failed_attempts}",
+def check_digit_code_failed_attempts(email: str, session_id: str):
+    failed_attempts_field = SessionStore.session_field(session_id, "failed_attempts")
+    [failed_attempts] = (
+        SessionStore.write(email)
+        .incr(failed_attempts_field, 1, SessionStore.digit_code_ttl)
+        .execute()
     )
+    if failed_attempts > 2:
+        SessionStore.write(email).delete(
+            SessionStore.session_field(session_id, "digit_code"),
+            failed_attempts_field,
+        ).execute()
+        raise OTPFailedAttemptsError()
 
 
-def send_mail(to_email: str, subject: str, body: str):
+def send_mail(to_email: str, subject: str, body: str) -> str:
+    mail = MailOutboxCrud.create(
+        {"to_email": to_email, "subject": subject, "body": body}
+    )
     try:
-        configuration = ConfigurationCrud.get_partial({}, ["email_configuration"])
-        configuration = configuration.email_configuration
-        context = ssl.create_default_context()
-        smtp_server = smtplib.SMTP_SSL(
-            configuration.server, configuration.port, context
-        )
-        smtp_server.ehlo()
-        smtp_server.login(configuration.email_address, configuration.password)
-
-        message = MIMEMultipart()
-        message["From"] = configuration.email_address
-        message["To"] = to_email
-        message["Subject"] = subject
-
-        text = MIMEText(body, "html")
-        message.attach(text)
-
-        smtp_server.sendmail(configuration.email_address, to_email, message.as_string())
-    except:
-        raise SendMailException()
-    finally:
-        smtp_server.close()
+        client.send_task("core.mail.tasks.deliver_mail", args=[str(mail.id)])
+    except Exception as error:
+        logger.error(f"Mail {mail.id} queued for redispatch: {error}")
+    return str(mail.id)
+
+
+def send_mails(mails: list[dict]) -> list[str]:
+    mail_ids = MailOutboxCrud.create_many(mails)
+    for index in range(0, len(mail_ids), settings.MAIL_BATCH_SIZE):
+        batch = mail_ids[index : index + settings.MAIL_BATCH_SIZE]
+        try:
+            client.send_task("core.mail.tasks.deliver_mail_batch", args=[batch])
+        except Exception as error:
+            logger.error(f"Mails {batch} queued for redispatch: {error}")
+    return mail_ids
 
 
 def get_mail_template(firstname, digit_code):
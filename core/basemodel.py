@@ -18,24 +18,50 @@ from mongoengine import (
     StringField,
     BooleanField,
 )
+from mongoengine.base import BaseField
 
+from core.constant import UPDATE_OPERATORS_TUPLE
 from core.exception import ValidationError
-from core.signals import post_modify
+from core.signals import post_modify, pre_modify
+
+
+def to_mongo_value(field: BaseField, value):
+    if value is None:
+        return None
+    return field.to_mongo(field.to_python(value))
+
+
+def not_deleted_index(*fields: str, **options) -> dict:
+    return {
+        "fields": list(fields),
+        "partialFilterExpression": {"is_deleted": False},
+        **options,
+    }
+
+
+def deleted_index(*fields: str, **options) -> dict:
+    return {
+        "fields": list(fields),
+        "partialFilterExpression": {"is_deleted": True},
+        **options,
+    }
 
 
 class BaseModel(Document):
-    meta = {"abstract": True}
+    meta = {"abstract": True, "auto_create_index": False}
     created_at = DateTimeField(default=datetime.utcnow)
     updated_at = DateTimeField(default=datetime.utcnow)
     is_deleted = BooleanField(required=True, default=False)
     deleted_at = DateTimeField()
 
     def modify(self, update_fields: dict, signal_kwargs=None, query=None):
+        update_fields = self._drop_unchanged_fields(update_fields)
+        if not update_fields:
+            return
         will_be_updated = self._get_updated_fields(update_fields)
-        update_fields["updated_at"] = datetime.now(timezone.utc)
+        fields = self._get_modify_fields(update_fields, datetime.now(timezone.utc))
         old_instance = deepcopy(self)
-        super().modify(query=query, **update_fields)
-        update_fields.pop("updated_at")
+        super().modify(query=query, **fields)
         if not signal_kwargs:
             signal_kwargs = {}
 
@@ -59,6 +85,43 @@ class BaseModel(Document):
             if isinstance(v, (GenericReferenceField, ReferenceField))
         }
 
+    @classmethod
+    def get_generic_reference_fields(cls) -> set[str]:
+        return {
+            k
+            for k, v in cls.__dict__.items()
+            if isinstance(getattr(v, "field", v), GenericReferenceField)
+        }
+
+    @classmethod
+    def get_archive_collection_name(cls) -> str:
+        return f"{cls._get_collection_name()}_archive"
+
+    @classmethod
+    def get_set_field(cls, key: str) -> tuple[str, BaseField] | None:
+        operator, *path = key.split("__")
+        if operator not in UPDATE_OPERATORS_TUPLE:
+            operator, path = "set", [operator, *path]
+        if operator not in ("set", "unset") or len(path) != 1:
+            return None
+        if field := cls._fields.get(path[0]):
+            return operator, field
+
+    @classmethod
+    def get_unchanged_query(cls, update_fields: dict) -> dict:
+        conditions = []
+        for key, value in update_fields.items():
+            if callable(value) or not (set_field := cls.get_set_field(key)):
+                return {}
+            operator, field = set_field
+            if operator == "unset":
+                conditions.append({field.db_field: {"$exists": True}})
+            else:
+                conditions.append(
+                    {field.db_field: {"$ne": to_mongo_value(field, value)}}
+                )
+        return {"$or": conditions} if conditions else {}
+
     @classmethod
     def get_embedded_fields_model(cls) -> dict[str]:
         fields = {}
@@ -70,6 +133,37 @@ class BaseModel(Document):
 
         return fields
 
+    def _get_modify_fields(self, update_fields: dict, updated_at: datetime) -> dict:
+        return {
+            **update_fields,
+            "updated_at": updated_at,
+            **self._get_extra_modify_fields(update_fields),
+        }
+
+    def _get_extra_modify_fields(self, update_fields: dict) -> dict:
+        fields = {}
+        for _, extra_fields in pre_modify.send(
+            self.__class__, document=self, update_fields=update_fields
+        ):
+            fields.update(extra_fields or {})
+        return fields
+
+    def _drop_unchanged_fields(self, update_fields: dict) -> dict:
+        return {
+            key: value
+            for key, value in update_fields.items()
+            if not self._is_unchanged(key, value)
+        }
+
+    def _is_unchanged(self, key: str, value) -> bool:
+        if callable(value) or not (set_field := self.get_set_field(key)):
+            return False
+        operator, field = set_field
+        current = to_mongo_value(field, self._data.get(field.name))
+        if operator == "unset":
+            return current is None
+        return current == to_mongo_value(field, value)
+
     def _get_updated_fields(self, update_fields: dict) -> dict:
         updated_fields = {}
         for k, v in update_fields.items():
@@ -7,26 +7,42 @@ from core.audit.audit_handlers.role import RoleAuditHandler
 from core.audit.audit_handlers.user import UserAuditHandler
 from core.auth.models.role import Role
 from core.auth.models.user import User
+from core.config import settings
 from core.functions import connect_db
-from core.signals import non_db_signal, post_modify
+from core.lib.index_manager import IndexManager
+from core.signals import (
+    non_db_signal,
+    post_bulk_create,
+    post_bulk_delete,
+    post_bulk_modify,
+    post_modify,
+)
 
 sys.path.append("/core")
 connect_db()
+IndexManager.create_missing_indexes(unique_only=True)
 
 app = Celery(
     name=__name__,
-    broker="redis://redis:6379/0",
-    backend="redis://redis:6379/0",
+    broker=settings.CELERY_BROKER_URL,
+    backend=settings.CELERY_BROKER_URL,
+    include=["core.mail.tasks", "core.archive.tasks"],
 )
 
 config = {
     "redbeat_redis_url": "redis://redis:6379/1",
     "redbeat_lock_timeout": 40,
+    "beat_schedule": {
+        "redispatch-pending-mails": {
+            "task": "core.mail.tasks.redispatch_pending_mails",
+            "schedule": settings.MAIL_REDISPATCH_AFTER,
+        },
+        "archive-deleted-documents": {
+            "task": "core.archive.tasks.archive_deleted_documents",
+            "schedule": settings.ARCHIVE_INTERVAL,
+        },
+    },
 }
-print("------------------------------------------------")
-
-import ipdb
-ipdb.set_trace()
 
 app.conf.update(**config)
 
@@ -38,4 +54,9 @@ signals.post_save.connect(RoleAuditHandler.create_audit_for_create_opr, sender=R
 post_modify.connect(RoleAuditHandler.create_audit_for_update_opr, sender=Role)
 signals.post_delete.connect(RoleAuditHandler.create_audit_for_delete_opr, sender=Role)
 
+for handler, sender in ((UserAuditHandler, User), (RoleAuditHandler, Role)):
+    post_bulk_create.connect(handler.create_audits_for_bulk_create_opr, sender=sender)
+    post_bulk_modify.connect(handler.create_audits_for_bulk_update_opr, sender=sender)
+    post_bulk_delete.connect(handler.create_audits_for_bulk_delete_opr, sender=sender)
+
 non_db_signal.connect(UserAuditHandler.create_audit_for_login_opr, sender=User)
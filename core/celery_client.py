@@ -0,0 +1,5 @@
+from celery import Celery
+
+from core.config import settings
+
+client = Celery(name="core", broker=settings.CELERY_BROKER_URL)
@@ -10,6 +10,37 @@ class Settings(BaseSettings):
     EXPECTED_ORIGIN = "http://localhost:3000"
     TIMEOUT = "60000"
     FILE_PATH = "data/files"
+    PRINCIPAL_CACHE_TTL = 900
+    TOKEN_CACHE_SIZE = 4096
+    PASSWORD_HASH_WORKERS = 2
+    PASSWORD_HASH_QUEUE_SIZE = 16
+    USER_BULK_CREATE_LIMIT = 50
+    RATE_LIMIT_CAPACITY = 60
+    RATE_LIMIT_REFILL_RATE = 1
+    CELERY_BROKER_URL = "redis://redis:6379/0"
+    MAIL_MAX_RETRIES = 5
+    MAIL_RETRY_BACKOFF = 60
+    MAIL_REDISPATCH_AFTER = 300
+    MAIL_SENDING_TIMEOUT = 600
+    SMTP_HOST_OVERRIDE: str | None = None
+    SMTP_PORT_OVERRIDE = 8025
+    SMTP_POOL_SIZE = 4
+    SMTP_CONNECTION_MAX_MESSAGES = 500
+    SMTP_HEALTH_CHECK_AFTER = 30
+    MAIL_BATCH_SIZE = 100
+    AUDIT_COUNT_LIMIT = 10000
+    MAIL_OUTBOX_RETENTION = 60 * 60 * 24 * 30
+    SLOW_QUERY_THRESHOLD_MS = 100
+    SLOW_QUERY_TOP_N = 50
+    SLOW_QUERY_TTL = 60 * 60 * 24 * 7
+    ARCHIVE_AFTER = 60 * 60 * 24 * 30
+    ARCHIVE_BATCH_SIZE = 500
+    ARCHIVE_INTERVAL = 60 * 60
+    EXPORT_BATCH_SIZE = 1000
+    EXPORT_CHUNK_SIZE = 64 * 1024
+    SEARCH_MAX_GRAM = 15
+    SEARCH_BACKFILL_BATCH_SIZE = 1000
+    QUERY_CACHE_TTL = 300
 
     class Config:
         env_file = ".env"
@@ -128,6 +128,28 @@ class OTPFailedAttemptsError(BaseCoreException):
         super().__init__("Too many incorrect entries", *args)
 
 
+class PasswordHashingBusyError(BaseCoreException):
+    def __init__(self, *args: object) -> None:
+        super().__init__("Too many authentication requests, try again later", *args)
+
+
+class BulkLimitExceededError(BaseCoreException):
+    def __init__(self, limit: int, *args: object) -> None:
+        super().__init__(f"At most {limit} items can be processed at once", *args)
+
+
+class RateLimitExceededError(BaseCoreException):
+    def __init__(self, retry_after: int, *args: object) -> None:
+        super().__init__(
+            f"Too many requests, try again in {retry_after} seconds", *args
+        )
+
+
+class InvalidCursorError(BaseCoreException):
+    def __init__(self, *args: object) -> None:
+        super().__init__("Invalid pagination cursor", *args)
+
+
 class EncodeTokenError(BaseCoreException):
     def __init__(self, *args: object) -> None:
         super().__init__("An error occurred while creating the token.", *args)
@@ -0,0 +1,56 @@
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+from core.auth.models.user import User
+from core.auth.utilities.auth_handler import AuthHandler
+from core.auth.utilities.decorators import has_permission
+from core.auth.utilities.principal_cache import PrincipalCache
+from core.exception import BaseCoreException
+from core.export_management.routers.export.handlers.export import (
+    MEDIA_TYPES,
+    ExportFormatEnum,
+    ExportHandler,
+)
+
+router = APIRouter()
+
+
+def get_current_user(request: Request) -> User:
+    try:
+        payload = AuthHandler.decode_token_payload(
+            token=request.headers.get("Authorization"), scope="access_token"
+        )
+        return PrincipalCache.get(payload["sub"], payload["iat"], payload["exp"])
+    except BaseCoreException as error:
+        raise HTTPException(status_code=401, detail=str(error))
+
+
+@router.get("/export/{collection}")
+def export(
+    collection: str,
+    request: Request,
+    format: ExportFormatEnum = ExportFormatEnum.NDJSON,
+    fields: str | None = None,
+    user: User = Depends(get_current_user),
+):
+    """
+    collection = The values you enter must be users, accounts or audits
+    """
+
+    handler = ExportHandler.get_handler(collection)
+    if not has_permission(user, handler.permission):
+        raise HTTPException(status_code=403, detail=f"{user.email} not permitted")
+
+    selected_fields = handler.get_fields(fields)
+    raw_query = handler.get_raw_query(
+        handler.get_query(request.query_params.multi_items())
+    )
+    return StreamingResponse(
+        handler.stream(
+            handler.iter_rows(raw_query, selected_fields), selected_fields, format
+        ),
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{collection}.{format.value}"'
+        },
+    )
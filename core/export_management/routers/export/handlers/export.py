@@ -0,0 +1,208 @@
+import csv
+import dataclasses
+import io
+import json
+from datetime import datetime
+from typing import Iterator
+
+from bson import DBRef, ObjectId
+from fastapi import HTTPException
+from mongoengine import BooleanField, IntField
+from mongoengine.errors import InvalidQueryError, ValidationError
+
+from core.audit.models.audit import Audit
+from core.auth.models.account import Account
+from core.auth.models.permission import PermissionsEnum
+from core.auth.models.user import User
+from core.base_enum import BaseStrEnum
+from core.basemodel import BaseModel
+from core.config import settings
+from core.filter_lookup import FilterLookup, build_query
+
+LOOKUPS = {field.name for field in dataclasses.fields(FilterLookup)}
+LIST_LOOKUPS = {"in_list", "not_in_list"}
+RESERVED_PARAMS = {"format", "fields"}
+
+
+class ExportFormatEnum(BaseStrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormatEnum.NDJSON: "application/x-ndjson",
+    ExportFormatEnum.CSV: "text/csv",
+}
+
+
+def to_export_value(value):
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, DBRef):
+        return str(value.id)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, dict):
+        if "_ref" in value:
+            return to_export_value(value["_ref"])
+        return {key: to_export_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [to_export_value(item) for item in value]
+    return value
+
+
+def to_csv_value(value):
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return value
+
+
+def parse_value(field, value: str):
+    if isinstance(field, BooleanField):
+        return value.lower() in ("true", "1")
+    if isinstance(field, IntField):
+        return int(value)
+    return value
+
+
+class ExportHandler:
+    model: type[BaseModel]
+    permission: PermissionsEnum
+    fields: tuple[str, ...]
+
+    @staticmethod
+    def get_handler(collection: str) -> type["ExportHandler"]:
+        if collection not in VALID_COLLECTIONS:
+            raise HTTPException(status_code=404, detail="Not found")
+        return VALID_COLLECTIONS[collection]
+
+    @classmethod
+    def get_fields(cls, fields: str | None) -> list[str]:
+        if not fields:
+            return list(cls.fields)
+        selected = [field.strip() for field in fields.split(",") if field.strip()]
+        if unknown := set(selected) - set(cls.fields):
+            raise HTTPException(
+                status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+            )
+        return selected
+
+    @classmethod
+    def get_query(cls, params: list[tuple[str, str]]) -> dict:
+        query = {}
+        for key, value in params:
+            if key in RESERVED_PARAMS:
+                continue
+            field_name, _, lookup = key.partition("__")
+            if field_name not in cls.fields or (lookup and lookup not in LOOKUPS):
+                raise HTTPException(status_code=400, detail=f"Invalid filter: {key}")
+            field = cls.model._fields[field_name]
+            try:
+                if lookup in LIST_LOOKUPS:
+                    value = [parse_value(field, item) for item in value.split(",")]
+                else:
+                    value = parse_value(field, value)
+            except ValueError:
+                raise HTTPException(status_code=400, detail=f"Invalid value: {key}")
+            if lookup:
+                query |= build_query({field_name: FilterLookup(**{lookup: value})})
+            else:
+                query[field_name] = value
+        return query
+
+    @classmethod
+    def get_raw_query(cls, query: dict) -> dict:
+        try:
+            return cls.model.objects.filter(**query, is_deleted=False)._query
+        except (InvalidQueryError, ValidationError, ValueError) as error:
+            raise HTTPException(status_code=400, detail=str(error))
+
+    @classmethod
+    def iter_rows(cls, raw_query: dict, fields: list[str]) -> Iterator[dict]:
+        db_fields = {cls.model._fields[field].db_field: field for field in fields}
+        with cls.model._get_collection().find(
+            raw_query,
+            projection=dict.fromkeys(db_fields, 1),
+            sort=[("_id", 1)],
+            batch_size=settings.EXPORT_BATCH_SIZE,
+        ) as cursor:
+            for son in cursor:
+                yield {
+                    field: to_export_value(son.get(db_field))
+                    for db_field, field in db_fields.items()
+                }
+
+    @classmethod
+    def stream(
+        cls, rows: Iterator[dict], fields: list[str], format: ExportFormatEnum
+    ) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if format == ExportFormatEnum.CSV:
+            writer.writerow(fields)
+        for row in rows:
+            if format == ExportFormatEnum.CSV:
+                writer.writerow([to_csv_value(row[field]) for field in fields])
+            else:
+                buffer.write(json.dumps(row, default=str))
+                buffer.write("\n")
+            if buffer.tell() >= settings.EXPORT_CHUNK_SIZE:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+
+
+class UserExportHandler(ExportHandler):
+    model = User
+    permission = PermissionsEnum.USER_READ_VALUES
+    fields = (
+        "id",
+        "email",
+        "role",
+        "account",
+        "user_type",
+        "is_superuser",
+        "is_two_factor_auth_enabled",
+        "verified_at",
+        "created_at",
+        "updated_at",
+    )
+
+
+class AccountExportHandler(ExportHandler):
+    model = Account
+    permission = PermissionsEnum.ACCOUNT_READ_VALUES
+    fields = (
+        "id",
+        "firstname",
+        "lastname",
+        "phone",
+        "job_title",
+        "created_at",
+        "updated_at",
+    )
+
+
+class AuditExportHandler(ExportHandler):
+    model = Audit
+    permission = PermissionsEnum.AUDIT_READ_VALUES
+    fields = (
+        "id",
+        "created_by",
+        "model",
+        "model_name",
+        "activity",
+        "message",
+        "source_address",
+        "source_user_agent",
+        "data",
+        "created_at",
+    )
+
+
+VALID_COLLECTIONS = {
+    "users": UserExportHandler,
+    "accounts": AccountExportHandler,
+    "audits": AuditExportHandler,
+}
@@ -6,7 +6,7 @@ import os
 from mongoengine import connect
 
 from core.logging.config import configure_colorized_logging
-
+from core.monitoring.slow_query import SlowQueryListener
 
 
 def import_module_by_path(path: str):
@@ -35,4 +35,8 @@ def initialize_logger():
 
 
 def connect_db():
-    connect("app", host="mongodb://mongo:27017/")
+    connect(
+        "app",
+        host="mongodb://mongo:27017/",
+        event_listeners=[SlowQueryListener()],
+    )
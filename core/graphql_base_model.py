@@ -160,6 +160,7 @@ class BaseGraphQLQueryMetaInput(BaseGraphQLModel):
     offset: Optional[int] = 0
     limit: Optional[int] = 0
     order_by: Optional[List[OrderByInput]] = StrawberryField(default_factory=list)
+    cursor: Optional[str] = None
 
 
 @strawberry.type
@@ -168,4 +169,7 @@ class BaseGraphQLQueryMeta:
     limit: int = 0
     has_more: bool
     order_by: List[OrderByOutput]
-    count: int = 0
+    count: Optional[int] = None
+    is_count_approximate: bool = False
+    cursor: Optional[str] = None
+    next_cursor: Optional[str] = None
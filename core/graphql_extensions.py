@@ -0,0 +1,84 @@
+from fastapi.concurrency import run_in_threadpool
+from graphql import (
+    ExecutionResult,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+)
+from strawberry.extensions import SchemaExtension
+
+from core.exception import RateLimitExceededError
+from core.monitoring.slow_query import current_operation
+from core.rate_limit import RateLimiter
+
+
+def get_root_field_names(document, operation_name: str | None) -> list[str]:
+    fragments = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+    operations = [
+        definition
+        for definition in document.definitions
+        if isinstance(definition, OperationDefinitionNode)
+        and (
+            operation_name is None
+            or definition.name is not None
+            and definition.name.value == operation_name
+        )
+    ]
+    if len(operations) != 1:
+        return []
+
+    field_names = []
+    selections = list(operations[0].selection_set.selections)
+    while selections:
+        selection = selections.pop()
+        if isinstance(selection, FieldNode):
+            field_names.append(selection.name.value)
+        elif isinstance(selection, InlineFragmentNode):
+            selections.extend(selection.selection_set.selections)
+        elif isinstance(selection, FragmentSpreadNode):
+            if fragment := fragments.get(selection.name.value):
+                selections.extend(fragment.selection_set.selections)
+    return field_names
+
+
+class RateLimitExtension(SchemaExtension):
+    async def on_execute(self):
+        execution_context = self.execution_context
+        source_info = execution_context.context.source_info
+        field_names = get_root_field_names(
+            execution_context.graphql_document, execution_context.operation_name
+        )
+        if source_info and field_names:
+            client = source_info["source_address"].rsplit(":", 1)[0]
+            # consume is a blocking redis round trip
+            retry_after = await run_in_threadpool(
+                RateLimiter.consume, client, RateLimiter.get_cost(field_names)
+            )
+            if retry_after is not None:
+                execution_context.result = ExecutionResult(
+                    data=None,
+                    errors=[GraphQLError(str(RateLimitExceededError(retry_after)))],
+                )
+        yield
+
+
+class OperationNameExtension(SchemaExtension):
+    def on_execute(self):
+        execution_context = self.execution_context
+        operation_name = execution_context.operation_name or ",".join(
+            get_root_field_names(
+                execution_context.graphql_document, execution_context.operation_name
+            )
+        )
+        token = current_operation.set(operation_name or None)
+        try:
+            yield
+        finally:
+            current_operation.reset(token)
@@ -0,0 +1,219 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi.concurrency import run_in_threadpool
+from mongoengine import signals
+from mongoengine.queryset import QuerySet
+from mongoengine.queryset.transform import update as transform_update
+from pymongo import ReturnDocument
+
+from core.basemodel import BaseModel
+from core.exception import DatabaseItemNotFound
+from core.lib.basecrud import validate_payload
+from core.lib.document_row import to_rows
+from core.lib.pagination import (
+    apply_cursor,
+    apply_ordering,
+    build_page_pipeline,
+    get_count_options,
+    get_next_cursor,
+    get_page_result,
+    get_sort_fields,
+)
+from core.lib.query_cache import QueryCache
+from core.lib.references import get_generic_references, set_generic_references
+from core.lib.search import apply_search
+from core.motor import Motor
+from core.signals import post_modify
+
+
+class AsyncCrud:
+    model: BaseModel
+    count_limit: int | None = None
+    cache_ttl: int | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.cache_ttl:
+            QueryCache.register(cls.model)
+
+    @classmethod
+    def get_collection(cls):
+        return Motor.get_collection(cls.model._get_collection_name())
+
+    @classmethod
+    async def get(cls, **kwargs):
+        if instance := await cls.find(**kwargs):
+            return instance
+        else:
+            raise DatabaseItemNotFound(cls.model.__name__)
+
+    @classmethod
+    async def find(cls, **kwargs):
+        son = await cls.get_collection().find_one(cls._get_raw_query(kwargs))
+        return son and cls.model._from_son(son)
+
+    @classmethod
+    async def get_many_partial_with_pagination(
+        cls,
+        query: dict,
+        fields: set,
+        offset: int = 0,
+        limit: int = 0,
+        order_by: Optional[list] = None,
+        search_text: Optional[str] = None,
+        cursor: Optional[str] = None,
+        with_count: bool = True,
+        as_rows: bool = False,
+    ) -> tuple[list, bool, int | None, str | None]:
+        query["is_deleted"] = False
+        query_set = cls.model.objects.filter(**query)
+        if search_text:
+            query_set = apply_search(query_set, search_text)
+        query_set = apply_ordering(
+            query_set.only(*fields, *get_sort_fields(order_by)), order_by
+        )
+        ordering = query_set._ordering
+
+        if cls.cache_ttl:
+            key = QueryCache.get_key(
+                query_set, offset, limit, cursor, with_count, cls.count_limit
+            )
+            generation, page = await run_in_threadpool(QueryCache.get, cls.model, key)
+            if page is None:
+                page = await cls._get_page(query_set, offset, limit, cursor, with_count)
+                await run_in_threadpool(
+                    QueryCache.set, cls.model, generation, key, page, cls.cache_ttl
+                )
+            sons, count = page
+        else:
+            sons, count = await cls._get_page(
+                query_set, offset, limit, cursor, with_count
+            )
+
+        await cls._dereference(sons, fields)
+        if as_rows:
+            data = to_rows(cls.model, sons)
+        else:
+            data = [cls.model._from_son(son) for son in sons]
+
+        if len(data) > limit and limit != 0:
+            data = data[:-1]
+            return data, True, count, get_next_cursor(data, ordering, True)
+
+        return data, False, count, None
+
+    @classmethod
+    async def _get_page(
+        cls,
+        query_set: QuerySet,
+        offset: int,
+        limit: int,
+        cursor: Optional[str],
+        with_count: bool,
+    ) -> tuple[list[dict], int | None]:
+        _limit = limit + 1 if limit else 0  # if limit equals 0 pull all
+        collection = cls.get_collection()
+        if limit and with_count and not cursor:
+            [result] = await collection.aggregate(
+                build_page_pipeline(query_set, offset, _limit, cls.count_limit)
+            ).to_list(1)
+            return get_page_result(result)
+
+        count_query = query_set._query
+        if cursor:
+            query_set = apply_cursor(query_set, cursor)
+            offset = 0
+        find_cursor = collection.find(
+            query_set._query,
+            projection=query_set._loaded_fields.as_dict(),
+            sort=query_set._ordering,
+            skip=offset,
+            limit=_limit,
+        )
+        if limit and with_count:
+            return await asyncio.gather(
+                find_cursor.to_list(None),
+                collection.count_documents(
+                    count_query, **get_count_options(cls.count_limit)
+                ),
+            )
+        sons = await find_cursor.to_list(None)
+        return sons, None if limit else len(sons)
+
+    @classmethod
+    async def count(cls, **kwargs) -> int:
+        return await cls.get_collection().count_documents(cls._get_raw_query(kwargs))
+
+    @classmethod
+    async def update(
+        cls, query: dict, update_fields: dict, signal_kwargs: None | dict = None
+    ) -> BaseModel:
+        validate_payload(cls.model, update_fields)
+        instance = await cls.get(**query)
+        update_fields = instance._drop_unchanged_fields(update_fields)
+        if not update_fields:
+            return instance
+        will_be_updated = instance._get_updated_fields(update_fields)
+        son = await cls.get_collection().find_one_and_update(
+            {"_id": instance.pk},
+            transform_update(
+                cls.model,
+                **instance._get_modify_fields(
+                    update_fields, datetime.now(timezone.utc)
+                ),
+            ),
+            return_document=ReturnDocument.AFTER,
+        )
+        # receivers write audits and hit redis, keep them off the event loop
+        await run_in_threadpool(
+            post_modify.send,
+            cls.model,
+            document=instance,
+            update_fields=will_be_updated,
+            **(signal_kwargs or {}),
+        )
+        return cls.model._from_son(son)
+
+    @classmethod
+    async def delete(cls, id: str, signal_kwargs: None | dict = None) -> bool:
+        instance = await cls.get(id=id)
+        await cls.get_collection().update_one(
+            {"_id": instance.pk},
+            {"$set": {"is_deleted": True, "deleted_at": datetime.utcnow()}},
+        )
+        await run_in_threadpool(
+            signals.post_delete.send,
+            cls.model,
+            document=instance,
+            **(signal_kwargs or {}),
+        )
+        return True
+
+    @classmethod
+    def _get_raw_query(cls, query: dict) -> dict:
+        return cls.model.objects.filter(**query, is_deleted=False)._query
+
+    @classmethod
+    async def _dereference(cls, sons: list[dict], fields: set):
+        db_fields = [
+            cls.model._fields[field_name].db_field
+            for field_name in fields.intersection(
+                cls.model.get_generic_reference_fields()
+            )
+        ]
+        documents = {}
+        for model, ids in get_generic_references(sons, db_fields).items():
+            cursor = Motor.get_collection(model._get_collection_name()).find(
+                {"_id": {"$in": list(ids)}}
+            )
+            async for son in cursor:
+                documents[son["_id"]] = model._from_son(son)
+            if model._meta.get("archive") and (missing := ids - documents.keys()):
+                cursor = Motor.get_collection(model.get_archive_collection_name()).find(
+                    {"_id": {"$in": list(missing)}}
+                )
+                async for son in cursor:
+                    documents[son["_id"]] = model._from_son(son)
+        set_generic_references(sons, db_fields, documents)
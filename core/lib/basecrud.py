@@ -1,14 +1,40 @@
 from abc import abstractmethod
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
-from mongoengine import signals
+from bson import ObjectId
+from mongoengine import NotUniqueError, signals
+from mongoengine.queryset import QuerySet
+from mongoengine.queryset.transform import update as transform_update
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
+from core.archive.archiver import Archiver
 from core.basemodel import BaseModel
 from core.constant import UPDATE_OPERATORS_TUPLE
+from core.lib.document_row import to_rows
+from core.lib.pagination import (
+    apply_cursor,
+    apply_ordering,
+    build_page_pipeline,
+    get_count_options,
+    get_next_cursor,
+    get_page_result,
+    get_sort_fields,
+)
+from core.lib.query_cache import QueryCache
+from core.lib.references import get_generic_references, set_generic_references
+from core.lib.search import apply_search, get_search_update
+from core.signals import (
+    post_bulk_create,
+    post_bulk_delete,
+    post_bulk_modify,
+    post_modify,
+)
 from core.utils import convert_to_snake_case
 from core.exception import (
     AlreadyExistWithSameName,
+    BaseCoreException,
     DatabaseItemNotFound,
     FieldTypeError,
 )
@@ -16,6 +42,13 @@ from core.exception import (
 
 class Crud:
     model: BaseModel
+    count_limit: int | None = None
+    cache_ttl: int | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.cache_ttl:
+            QueryCache.register(cls.model)
 
     @classmethod
     @abstractmethod
@@ -91,37 +124,141 @@ class Crud:
         limit: int = 0,
         order_by: Optional[list] = None,
         search_text: Optional[str] = None,
-    ) -> tuple[list, bool, int]:
-        _limit = limit + 1 if limit else 0  # if limit equals 0 pull all
-        if not order_by:
-            order_by = []
+        cursor: Optional[str] = None,
+        with_count: bool = True,
+        as_rows: bool = False,
+    ) -> tuple[list, bool, int | None, str | None]:
         query["is_deleted"] = False
-        reference_fields = cls.model.get_reference_fields()
-        _order_by = [convert_to_snake_case(str(order)) for order in order_by]
-        query_set = (
-            cls.model.objects.filter(**query)
-            .search_text(search_text)
-            .only(*fields)
-            .order_by(*_order_by)
-            .skip(offset)
-            .limit(_limit)
-            if search_text
-            else cls.model.objects.filter(**query)
-            .only(*fields)
-            .order_by(*_order_by)
-            .skip(offset)
-            .limit(_limit)
+        query_set = cls.model.objects.filter(**query)
+        if search_text:
+            query_set = apply_search(query_set, search_text)
+        query_set = apply_ordering(
+            query_set.only(*fields, *get_sort_fields(order_by)), order_by
         )
-        count = query_set.count() if limit else len(query_set)
-        if fields.intersection(reference_fields):
-            query_set = query_set.select_related()
+        ordering = query_set._ordering
 
-        data = list(query_set)
+        if cls.cache_ttl:
+            sons, count = QueryCache.get_or_set(
+                cls.model,
+                QueryCache.get_key(
+                    query_set, offset, limit, cursor, with_count, cls.count_limit
+                ),
+                cls.cache_ttl,
+                lambda: cls._get_page(query_set, offset, limit, cursor, with_count),
+            )
+        else:
+            sons, count = cls._get_page(query_set, offset, limit, cursor, with_count)
+
+        cls._dereference(sons, fields)
+        if as_rows:
+            data = to_rows(cls.model, sons)
+        else:
+            data = [cls.model._from_son(son) for son in sons]
 
         if len(data) > limit and limit != 0:
-            return data[:-1], True, count
+            data = data[:-1]
+            return data, True, count, get_next_cursor(data, ordering, True)
 
-        return data, False, count
+        return data, False, count, None
+
+    @classmethod
+    def _get_page(
+        cls,
+        query_set: QuerySet,
+        offset: int,
+        limit: int,
+        cursor: Optional[str],
+        with_count: bool,
+    ) -> tuple[list[dict], int | None]:
+        _limit = limit + 1 if limit else 0  # if limit equals 0 pull all
+        if limit and with_count and not cursor:
+            [result] = cls.model._get_collection().aggregate(
+                build_page_pipeline(query_set, offset, _limit, cls.count_limit)
+            )
+            return get_page_result(result)
+
+        count = (
+            cls.model._get_collection().count_documents(
+                query_set._query, **get_count_options(cls.count_limit)
+            )
+            if limit and with_count
+            else None
+        )
+        if cursor:
+            query_set = apply_cursor(query_set, cursor)
+        else:
+            query_set = query_set.skip(offset)
+        sons = list(query_set.limit(_limit).as_pymongo())
+        if not limit:
+            count = len(sons)
+        return sons, count
+
+    @classmethod
+    def _dereference(cls, sons: list[dict], fields: set):
+        db_fields = [
+            cls.model._fields[field_name].db_field
+            for field_name in fields.intersection(
+                cls.model.get_generic_reference_fields()
+            )
+        ]
+        documents = {}
+        for model, ids in get_generic_references(sons, db_fields).items():
+            for son in model._get_collection().find({"_id": {"$in": list(ids)}}):
+                documents[son["_id"]] = model._from_son(son)
+            if model._meta.get("archive") and (missing := ids - documents.keys()):
+                for son in Archiver.get_archive_collection(model).find(
+                    {"_id": {"$in": list(missing)}}
+                ):
+                    documents[son["_id"]] = model._from_son(son)
+        set_generic_references(sons, db_fields, documents)
+
+    @classmethod
+    def modify_one(
+        cls, query: dict, update_fields: dict, signal_kwargs: None | dict = None
+    ) -> BaseModel:
+        collection = cls.model._get_collection()
+        query = cls.model.objects.filter(**query, is_deleted=False)._query
+        unchanged_query = cls.model.get_unchanged_query(update_fields)
+        search_update = get_search_update(cls.model, update_fields)
+        update = transform_update(
+            cls.model,
+            **update_fields,
+            **search_update,
+            updated_at=datetime.now(timezone.utc),
+        )
+        try:
+            son = update_fields and collection.find_one_and_update(
+                {"$and": [query, unchanged_query]} if unchanged_query else query,
+                update,
+                return_document=ReturnDocument.BEFORE,
+            )
+        except DuplicateKeyError:
+            raise cls.get_unique_exception()
+        if not son:
+            if son := collection.find_one(query):
+                return cls.model._from_son(son)
+            raise DatabaseItemNotFound(cls.model.__name__)
+        old_document = cls.model._from_son(son)
+        update_fields = old_document._drop_unchanged_fields(update_fields)
+        extra_fields = old_document._get_extra_modify_fields(update_fields)
+        # search tokens already written with the update need no second write
+        if extra_fields and extra_fields != search_update:
+            new_son = collection.find_one_and_update(
+                {"_id": son["_id"]},
+                transform_update(cls.model, **extra_fields),
+                return_document=ReturnDocument.AFTER,
+            )
+        else:
+            new_son = get_updated_son(son, update) or collection.find_one(
+                {"_id": son["_id"]}
+            )
+        post_modify.send(
+            cls.model,
+            document=old_document,
+            update_fields=old_document._get_updated_fields(update_fields),
+            **(signal_kwargs or {}),
+        )
+        return cls.model._from_son(new_son)
 
     @classmethod
     def get_latest(cls, **kwargs):
@@ -136,37 +273,193 @@ class Crud:
 
     @classmethod
     def validate(cls, payload: dict):
-        for k, v in payload.items():
-            if not hasattr(cls.model, k):
-                continue
+        validate_payload(cls.model, payload)
+
+    @classmethod
+    def create_by_uniqueness(
+        cls, document: BaseModel, signal_kwargs: None | dict = None
+    ) -> BaseModel:
+        try:
+            document.save(signal_kwargs=signal_kwargs)
+        except NotUniqueError:
+            raise cls.get_unique_exception()
+        return document
 
-            first, *remain = k.split("__")
-            if first in UPDATE_OPERATORS_TUPLE:
-                k = "__".join(remain)
+    @classmethod
+    def get_unique_exception(cls) -> BaseCoreException:
+        return AlreadyExistWithSameName(str(cls.model.__name__).lower())
 
-            field = getattr(cls.model, k)
-            if (field.unique or field.required) and v is None:
-                raise FieldTypeError(f"{k} attribute cannot be null")
+    @classmethod
+    def bulk_create(
+        cls, documents: list[BaseModel], signal_kwargs: None | dict = None
+    ) -> list[BaseModel]:
+        if not documents:
+            return []
+        for document in documents:
+            signals.pre_save.send(cls.model, document=document)
+            document.validate()
+        sons = [document.to_mongo() for document in documents]
+        try:
+            cls.model._get_collection().insert_many(sons)
+        except BulkWriteError as error:
+            # inserts are ordered, everything before the failed one was written
+            cls._set_created(
+                documents[: error.details["nInserted"]], sons, signal_kwargs
+            )
+            if is_duplicate_key_error(error):
+                raise cls.get_unique_exception()
+            raise
+        cls._set_created(documents, sons, signal_kwargs)
+        return documents
 
     @classmethod
-    def create_by_uniqueness(
-        cls, document: dict, unique_field: dict, signal_kwargs: None | dict = None
+    def _set_created(
+        cls, documents: list[BaseModel], sons: list[dict], signal_kwargs: None | dict
     ):
-        if cls.count(**unique_field) != 0:
+        if not documents:
+            return
+        for document, son in zip(documents, sons):
+            document.pk = son["_id"]
+            document._clear_changed_fields()
+            document._created = False
+        post_bulk_create.send(cls.model, documents=documents, **(signal_kwargs or {}))
+
+    @classmethod
+    def bulk_create_by_uniqueness(
+        cls,
+        documents: list[BaseModel],
+        unique_field: str,
+        signal_kwargs: None | dict = None,
+    ) -> list[BaseModel]:
+        values = [document[unique_field] for document in documents]
+        if len(set(values)) != len(values) or cls.count(
+            **{f"{unique_field}__in": values}
+        ):
             raise AlreadyExistWithSameName(str(cls.model.__name__).lower())
-        document.save(signal_kwargs=signal_kwargs)
-        return document
+        return cls.bulk_create(documents, signal_kwargs=signal_kwargs)
+
+    @classmethod
+    def bulk_update(
+        cls, updates: dict[str, dict], signal_kwargs: None | dict = None
+    ) -> list[BaseModel]:
+        for update_fields in updates.values():
+            cls.validate(update_fields)
+        documents = cls.get_many_by_ids(list(updates))
+        updates = {str(ObjectId(id)): fields for id, fields in updates.items()}
+        updated_at = datetime.now(timezone.utc)
+        operations = []
+        changes = []
+        for document in documents:
+            update_fields = document._drop_unchanged_fields(updates[str(document.id)])
+            if not update_fields:
+                continue
+            operations.append(
+                UpdateOne(
+                    {"_id": document.pk},
+                    transform_update(
+                        cls.model,
+                        **document._get_modify_fields(update_fields, updated_at),
+                    ),
+                )
+            )
+            changes.append((document, document._get_updated_fields(update_fields)))
+        if not operations:
+            return documents
+        try:
+            cls.model._get_collection().bulk_write(operations, ordered=False)
+        except BulkWriteError as error:
+            failed = {
+                write_error["index"] for write_error in error.details["writeErrors"]
+            }
+            if applied := [
+                change for index, change in enumerate(changes) if index not in failed
+            ]:
+                post_bulk_modify.send(
+                    cls.model, changes=applied, **(signal_kwargs or {})
+                )
+            if is_duplicate_key_error(error):
+                raise cls.get_unique_exception()
+            raise
+        post_bulk_modify.send(cls.model, changes=changes, **(signal_kwargs or {}))
+        return cls.get_many_by_ids(list(updates))
+
+    @classmethod
+    def bulk_soft_delete(
+        cls, ids: list[str], signal_kwargs: None | dict = None
+    ) -> list[BaseModel]:
+        documents = cls.get_many_by_ids(ids)
+        cls.model._get_collection().update_many(
+            {"_id": {"$in": [document.pk for document in documents]}},
+            {"$set": {"is_deleted": True, "deleted_at": datetime.utcnow()}},
+        )
+        post_bulk_delete.send(cls.model, documents=documents, **(signal_kwargs or {}))
+        return documents
+
+    @classmethod
+    def get_many_by_ids(cls, ids: list[str]) -> list[BaseModel]:
+        if not all(ObjectId.is_valid(id) for id in ids):
+            raise DatabaseItemNotFound(cls.model.__name__)
+        ids = list(dict.fromkeys(str(ObjectId(id)) for id in ids))
+        documents = {
+            str(document.id): document
+            for document in cls.model.objects.filter(id__in=ids, is_deleted=False)
+        }
+        if len(documents) != len(ids):
+            raise DatabaseItemNotFound(cls.model.__name__)
+        return [documents[id] for id in ids]
 
     @classmethod
     def delete(cls, id: str, signal_kwargs: None | dict = None) -> bool:
         model_instance = cls.get(id=id)
         model_instance.update(is_deleted=True, deleted_at=datetime.utcnow)
-        if signal_kwargs:
-            signals.post_delete.send(
-                model_instance.__class__, document=model_instance, **signal_kwargs
-            )
+        signals.post_delete.send(
+            model_instance.__class__, document=model_instance, **(signal_kwargs or {})
+        )
         return True
 
+    @classmethod
+    def get_deleted(cls, id: str) -> BaseModel:
+        if document := cls.find_deleted(id):
+            return document
+        else:
+            raise DatabaseItemNotFound(cls.model.__name__)
+
+    @classmethod
+    def find_deleted(cls, id: str) -> BaseModel | None:
+        if ObjectId.is_valid(id):
+            return Archiver.find_deleted(cls.model, id)
+
+    @classmethod
+    def restore(
+        cls,
+        id: str,
+        unique_field: str | None = None,
+        signal_kwargs: None | dict = None,
+    ) -> BaseModel:
+        document = cls.get_deleted(id)
+        if unique_field and cls.count(**{unique_field: document[unique_field]}):
+            raise AlreadyExistWithSameName(str(cls.model.__name__).lower())
+        return cls.restore_document(document, signal_kwargs=signal_kwargs)
+
+    @classmethod
+    def restore_document(
+        cls, document: BaseModel, signal_kwargs: None | dict = None
+    ) -> BaseModel:
+        try:
+            Archiver.restore(document)
+        except DuplicateKeyError:
+            raise cls.get_unique_exception()
+        post_modify.send(
+            cls.model,
+            document=document,
+            update_fields={"is_deleted": False},
+            **(signal_kwargs or {}),
+        )
+        document.is_deleted = False
+        document.deleted_at = None
+        document._clear_changed_fields()
+        return document
+
     @classmethod
     def delete_many(cls, **query) -> bool:
         if not query:
@@ -194,3 +487,44 @@ class Crud:
                 fields[key] = value
 
         return fields
+
+
+def validate_payload(model: BaseModel, payload: dict):
+    for k, v in payload.items():
+        if not hasattr(model, k):
+            continue
+
+        first, *remain = k.split("__")
+        if first in UPDATE_OPERATORS_TUPLE:
+            k = "__".join(remain)
+
+        field = getattr(model, k)
+        if (field.unique or field.required) and v is None:
+            raise FieldTypeError(f"{k} attribute cannot be null")
+
+
+def is_duplicate_key_error(error: BulkWriteError) -> bool:
+    write_errors = error.details["writeErrors"]
+    return bool(write_errors) and all(
+        write_error["code"] == 11000 for write_error in write_errors
+    )
+
+
+def get_updated_son(son: dict, update: dict) -> dict | None:
+    if not update.keys() <= {"$set", "$unset"}:
+        return None
+    son = dict(son)
+    for operator, fields in update.items():
+        for path, value in fields.items():
+            *parents, key = path.split(".")
+            target = son
+            for parent in parents:
+                if not isinstance(target.get(parent), dict):
+                    return None
+                target[parent] = dict(target[parent])
+                target = target[parent]
+            if operator == "$set":
+                target[key] = value
+            else:
+                target.pop(key, None)
+    return son
@@ -0,0 +1,54 @@
+from mongoengine.base import BaseDocument
+from strawberry.dataloader import DataLoader
+from strawberry.types import Info
+
+from core.basemodel import BaseModel
+from core.motor import Motor
+
+
+def get_reference(root, name: str):
+    if isinstance(root, BaseDocument):
+        return root._data.get(name)
+    return root.__dict__.get(name)
+
+
+def reference_resolver(name: str, model: type[BaseModel]):
+    async def resolver(root, info: Info):
+        return await info.context.loaders.load(model, get_reference(root, name))
+
+    return resolver
+
+
+class ReferenceLoader(DataLoader):
+    def __init__(self, model: type[BaseModel]):
+        super().__init__(load_fn=self.load_documents)
+        self.model = model
+
+    async def load_documents(self, ids: list) -> list[BaseModel | None]:
+        cursor = Motor.get_collection(self.model._get_collection_name()).find(
+            {"_id": {"$in": list(set(ids))}}
+        )
+        documents = {son["_id"]: self.model._from_son(son) async for son in cursor}
+        if self.model._meta.get("archive") and (missing := set(ids) - documents.keys()):
+            cursor = Motor.get_collection(
+                self.model.get_archive_collection_name()
+            ).find({"_id": {"$in": list(missing)}})
+            documents.update(
+                {son["_id"]: self.model._from_son(son) async for son in cursor}
+            )
+        return [documents.get(id) for id in ids]
+
+
+class ReferenceLoaders:
+    def __init__(self):
+        self._loaders: dict[type[BaseModel], ReferenceLoader] = {}
+
+    def get(self, model: type[BaseModel]) -> ReferenceLoader:
+        if model not in self._loaders:
+            self._loaders[model] = ReferenceLoader(model)
+        return self._loaders[model]
+
+    async def load(self, model: type[BaseModel], value) -> BaseModel | None:
+        if value is None or isinstance(value, BaseDocument):
+            return value
+        return await self.get(model).load(getattr(value, "id", value))
@@ -0,0 +1,48 @@
+from functools import cache
+
+from mongoengine import EmbeddedDocumentField, ListField
+from mongoengine.base import BaseDocument
+
+
+@cache
+def get_field_map(model: type[BaseDocument]) -> dict[str, tuple[str, type | None]]:
+    field_map = {}
+    for name, field in model._fields.items():
+        if isinstance(field, ListField):
+            field = field.field
+        document_type = (
+            field.document_type if isinstance(field, EmbeddedDocumentField) else None
+        )
+        field_map[model._fields[name].db_field] = (name, document_type)
+    return field_map
+
+
+def to_rows(model: type[BaseDocument], sons: list[dict]) -> list["DocumentRow"]:
+    return [DocumentRow(model, son) for son in sons]
+
+
+class DocumentRow:
+    def __init__(self, model: type[BaseDocument], son: dict):
+        self._model = model
+        self._son = son
+        field_map = get_field_map(model)
+        for key, value in son.items():
+            if key not in field_map:
+                continue
+            name, document_type = field_map[key]
+            if document_type and value is not None:
+                if isinstance(value, list):
+                    value = to_rows(document_type, value)
+                else:
+                    value = DocumentRow(document_type, value)
+            self.__dict__[name] = value
+
+    def __getattr__(self, name: str):
+        if field := self._model._fields.get(name):
+            return field.default() if callable(field.default) else field.default
+        if isinstance(attribute := getattr(self._model, name, None), property):
+            return attribute.fget(self)
+        raise AttributeError(name)
+
+    def to_mongo(self) -> dict:
+        return self._son
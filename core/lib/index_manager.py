@@ -0,0 +1,129 @@
+from mongoengine.base.common import _document_registry
+from pymongo import IndexModel
+from pymongo.errors import OperationFailure
+
+from core.basemodel import BaseModel
+from core.functions import initialize_logger
+
+logger = initialize_logger()
+
+
+class IndexManager:
+    @staticmethod
+    def get_models() -> list[type[BaseModel]]:
+        return [
+            model
+            for model in _document_registry.values()
+            if issubclass(model, BaseModel) and not model._meta.get("abstract")
+        ]
+
+    @staticmethod
+    def get_declared_indexes(model: type[BaseModel]) -> dict[str, IndexModel]:
+        indexes = {}
+        for spec in model._meta["index_specs"]:
+            options = {key: value for key, value in spec.items() if key != "fields"}
+            index = IndexModel(spec["fields"], background=True, **options)
+            indexes[index.document["name"]] = index
+        return indexes
+
+    @classmethod
+    def create_missing_indexes(
+        cls, models: list[type[BaseModel]] | None = None, unique_only: bool = False
+    ) -> dict[str, list[str]]:
+        created = {}
+        failed = []
+        for model in models or cls.get_models():
+            collection = model._get_collection()
+            declared = cls.get_declared_indexes(model)
+            existing = collection.index_information()
+            for name, index in declared.items():
+                unique = index.document.get("unique", False)
+                if name in existing or unique_only and not unique:
+                    continue
+                try:
+                    cls.drop_superseded_indexes(collection, index, existing, declared)
+                    collection.create_indexes([index])
+                except OperationFailure as e:
+                    logger.error(
+                        f"Could not create index {name} on {collection.name}: {e}"
+                    )
+                    if unique:
+                        failed.append(f"{collection.name}.{name}")
+                    continue
+                created.setdefault(collection.name, []).append(name)
+            if collection.name in created:
+                logger.info(
+                    f"Created indexes on {collection.name}: {created[collection.name]}"
+                )
+        if failed:
+            raise RuntimeError(f"Could not create unique indexes: {', '.join(failed)}")
+        return created
+
+    @staticmethod
+    def drop_superseded_indexes(
+        collection, index: IndexModel, existing: dict[str, dict], declared: dict
+    ):
+        keys = list(index.document["key"].items())
+        partial = index.document.get("partialFilterExpression")
+        for name, other in list(existing.items()):
+            if (
+                name not in declared
+                and list(other["key"]) == keys
+                and other.get("partialFilterExpression") == partial
+            ):
+                collection.drop_index(name)
+                del existing[name]
+                logger.info(f"Dropped index {name} on {collection.name}, superseded")
+
+    @classmethod
+    def report(cls, models: list[type[BaseModel]] | None = None) -> list[dict]:
+        rows = []
+        for model in models or cls.get_models():
+            collection = model._get_collection()
+            declared = cls.get_declared_indexes(model)
+            existing = collection.index_information()
+            usage = {
+                stats["name"]: stats["accesses"]
+                for stats in collection.aggregate([{"$indexStats": {}}])
+            }
+            for name in declared.keys() - existing.keys():
+                rows.append(
+                    {"collection": collection.name, "name": name, "status": "missing"}
+                )
+            for name, index in existing.items():
+                if name == "_id_":
+                    continue
+                accesses = usage.get(name, {})
+                rows.append(
+                    {
+                        "collection": collection.name,
+                        "name": name,
+                        "status": get_index_status(
+                            name, index, existing, declared, accesses.get("ops", 0)
+                        ),
+                        "ops": accesses.get("ops", 0),
+                        "since": accesses.get("since"),
+                    }
+                )
+        return rows
+
+
+def get_index_status(
+    name: str, index: dict, existing: dict[str, dict], declared: dict, ops: int
+) -> str:
+    if name not in declared:
+        return "undeclared"
+    if index.get("unique") or "expireAfterSeconds" in index:
+        return "ok"
+    keys = list(index["key"])
+    for other_name, other in existing.items():
+        other_keys = list(other["key"])
+        if (
+            other_name != name
+            and len(other_keys) > len(keys)
+            and other_keys[: len(keys)] == keys
+            and other.get("partialFilterExpression")
+            == index.get("partialFilterExpression")
+        ):
+            return f"redundant ({other_name})"
+    return "ok" if ops else "unused"
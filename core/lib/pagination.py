@@ -0,0 +1,116 @@
+import base64
+import binascii
+
+from bson import SON, json_util
+from mongoengine import Q
+from mongoengine.queryset import QuerySet
+
+from core.basemodel import BaseModel
+from core.exception import InvalidCursorError
+from core.utils import convert_to_snake_case
+
+
+def apply_ordering(query_set: QuerySet, order_by: list | None) -> QuerySet:
+    _order_by = [convert_to_snake_case(str(order)) for order in order_by or []]
+    if not any(order.lstrip("+-") in ("id", "pk") for order in _order_by):
+        direction = "-" if _order_by and _order_by[-1].startswith("-") else "+"
+        _order_by.append(f"{direction}id")
+    return query_set.order_by(*_order_by)
+
+
+def get_sort_fields(order_by: list | None) -> set[str]:
+    return {
+        convert_to_snake_case(str(order)).lstrip("+-") for order in order_by or []
+    } | {"id"}
+
+
+def apply_cursor(query_set: QuerySet, cursor: str) -> QuerySet:
+    values = decode_cursor(cursor, query_set._ordering)
+    return query_set.filter(Q(__raw__=get_keyset_query(query_set._ordering, values)))
+
+
+def build_page_pipeline(
+    query_set: QuerySet, skip: int, limit: int, count_limit: int | None
+) -> list[dict]:
+    data_stages = [{"$skip": skip}] if skip else []
+    data_stages.append({"$limit": limit})
+    if projection := query_set._loaded_fields.as_dict():
+        data_stages.append({"$project": projection})
+    count_stages = [{"$limit": count_limit}] if count_limit else []
+    count_stages.append({"$count": "count"})
+    return [
+        {"$match": query_set._query},
+        {"$sort": SON(query_set._ordering)},
+        {"$facet": {"data": data_stages, "count": count_stages}},
+    ]
+
+
+def get_page_result(result: dict) -> tuple[list[dict], int]:
+    count = result["count"][0]["count"] if result["count"] else 0
+    return result["data"], count
+
+
+def get_count_options(count_limit: int | None) -> dict:
+    return {"limit": count_limit} if count_limit else {}
+
+
+def is_count_approximate(count: int | None, count_limit: int | None) -> bool:
+    return bool(count_limit) and count is not None and count >= count_limit
+
+
+def get_keyset_query(ordering: list[tuple[str, int]], values: list) -> dict:
+    clauses = []
+    for index, (key, direction) in enumerate(ordering):
+        clause = {
+            previous: values[i] for i, (previous, _) in enumerate(ordering[:index])
+        }
+        value = values[index]
+        if value is None:
+            if direction < 0:
+                continue
+            clause[key] = {"$ne": None}
+        else:
+            clause[key] = {"$gt" if direction > 0 else "$lt": value}
+        clauses.append(clause)
+    return {"$or": clauses} if clauses else {"_id": {"$exists": False}}
+
+
+def encode_cursor(document: BaseModel, ordering: list[tuple[str, int]]) -> str:
+    son = document.to_mongo()
+    payload = {
+        "keys": [key for key, _ in ordering],
+        "values": [get_path(son, key) for key, _ in ordering],
+    }
+    return base64.urlsafe_b64encode(json_util.dumps(payload).encode()).decode()
+
+
+def decode_cursor(cursor: str, ordering: list[tuple[str, int]]) -> list:
+    try:
+        payload = json_util.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError, TypeError):
+        raise InvalidCursorError()
+    keys = [key for key, _ in ordering]
+    if (
+        not isinstance(payload, dict)
+        or payload.get("keys") != keys
+        or len(payload.get("values") or []) != len(keys)
+    ):
+        raise InvalidCursorError()
+    return payload["values"]
+
+
+def get_next_cursor(
+    data: list, ordering: list[tuple[str, int]], has_more: bool
+) -> str | None:
+    if not (has_more and data):
+        return None
+    return encode_cursor(data[-1], ordering)
+
+
+def get_path(son: dict, key: str):
+    value = son
+    for part in key.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
@@ -0,0 +1,141 @@
+import hashlib
+from typing import Callable
+
+import bson
+from bson import json_util
+from mongoengine import signals
+from mongoengine.queryset import QuerySet
+
+from core.basemodel import BaseModel
+from core.redis import Redis
+from core.signals import (
+    post_bulk_create,
+    post_bulk_delete,
+    post_bulk_modify,
+    post_modify,
+)
+
+READ_CACHED_PAGE_SCRIPT = """
+local generation = redis.call("GET", KEYS[1]) or "0"
+local value = redis.call("GET", ARGV[1] .. generation .. ":" .. ARGV[2])
+if value then
+    redis.call("HINCRBY", KEYS[2], ARGV[3] .. ":hits", 1)
+else
+    redis.call("HINCRBY", KEYS[2], ARGV[3] .. ":misses", 1)
+end
+return {generation, value}
+"""
+
+
+class QueryCache:
+    prefix = "query_cache"
+    stats_key = "query_cache_stats"
+    _models: set[type[BaseModel]] = set()
+    _script = None
+
+    @classmethod
+    def get_script(cls):
+        if cls._script is None:
+            cls._script = Redis.register_script(READ_CACHED_PAGE_SCRIPT)
+        return cls._script
+
+    @classmethod
+    def register(cls, model: type[BaseModel]):
+        cls._models.add(model)
+
+    @staticmethod
+    def get_key(query_set: QuerySet, *args) -> str:
+        parts = [
+            query_set._query,
+            query_set._loaded_fields.as_dict(),
+            query_set._ordering,
+            *args,
+        ]
+        return hashlib.sha1(json_util.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+    @classmethod
+    def get(cls, model: type[BaseModel], key: str) -> tuple[str, tuple | None]:
+        collection = model._get_collection_name()
+        generation, value = cls.get_script()(
+            keys=[cls._get_generation_key(collection), cls.stats_key],
+            args=[f"{cls.prefix}:{collection}:", key, collection],
+        )
+        if value is None:
+            return generation.decode("utf-8"), None
+        page = bson.decode(value)
+        return generation.decode("utf-8"), (page["sons"], page["count"])
+
+    @classmethod
+    def set(
+        cls,
+        model: type[BaseModel],
+        generation: str,
+        key: str,
+        page: tuple[list[dict], int | None],
+        ttl: int,
+    ):
+        sons, count = page
+        Redis.set(
+            f"{cls.prefix}:{model._get_collection_name()}:{generation}:{key}",
+            bson.encode({"sons": sons, "count": count}),
+            exp=ttl,
+        )
+
+    @classmethod
+    def get_or_set(
+        cls,
+        model: type[BaseModel],
+        key: str,
+        ttl: int,
+        get_page: Callable[[], tuple[list[dict], int | None]],
+    ) -> tuple[list[dict], int | None]:
+        generation, page = cls.get(model, key)
+        if page is None:
+            page = get_page()
+            cls.set(model, generation, key, page, ttl)
+        return page
+
+    @classmethod
+    def invalidate(cls, sender, **kwargs):
+        if sender in cls._models:
+            cls.invalidate_model(sender)
+
+    @classmethod
+    def invalidate_model(cls, model: type[BaseModel]):
+        Redis.incr(cls._get_generation_key(model._get_collection_name()))
+
+    @classmethod
+    def get_stats(cls) -> list[dict]:
+        counters = {}
+        for field, value in Redis.get_hash(cls.stats_key).items():
+            collection, _, counter = field.rpartition(":")
+            counters.setdefault(collection, {"hits": 0, "misses": 0})[counter] = int(
+                value
+            )
+        collections = sorted(counters)
+        pipeline = Redis.pipeline(transaction=False)
+        for collection in collections:
+            pipeline.get(cls._get_generation_key(collection))
+        return [
+            {
+                "collection": collection,
+                **counters[collection],
+                "generation": int(generation or 0),
+            }
+            for collection, generation in zip(collections, pipeline.execute())
+        ]
+
+    @classmethod
+    def _get_generation_key(cls, collection: str) -> str:
+        return f"{cls.prefix}_generation:{collection}"
+
+
+for signal in (
+    signals.post_save,
+    signals.post_delete,
+    post_modify,
+    post_bulk_create,
+    post_bulk_modify,
+    post_bulk_delete,
+):
+    signal.connect(QueryCache.invalidate)
@@ -0,0 +1,37 @@
+from mongoengine.base import get_document
+
+from core.basemodel import BaseModel
+
+
+def get_generic_references(
+    sons: list[dict], db_fields: list[str]
+) -> dict[type[BaseModel], set]:
+    ids_by_model = {}
+    for son in sons:
+        for db_field in db_fields:
+            for value in iter_references(son.get(db_field)):
+                ids_by_model.setdefault(get_document(value["_cls"]), set()).add(
+                    value["_ref"].id
+                )
+    return ids_by_model
+
+
+def set_generic_references(sons: list[dict], db_fields: list[str], documents: dict):
+    for son in sons:
+        for db_field in db_fields:
+            value = son.get(db_field)
+            if isinstance(value, list):
+                son[db_field] = [
+                    documents.get(reference["_ref"].id)
+                    for reference in iter_references(value)
+                ]
+            elif value:
+                son[db_field] = documents.get(value["_ref"].id)
+
+
+def iter_references(value) -> list[dict]:
+    if not value:
+        return []
+    if isinstance(value, list):
+        return [reference for reference in value if isinstance(reference, dict)]
+    return [value] if isinstance(value, dict) else []
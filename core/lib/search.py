@@ -0,0 +1,146 @@
+import re
+import unicodedata
+from typing import Iterable
+
+from mongoengine import ListField, StringField, signals
+from mongoengine.queryset import QuerySet
+from pymongo import UpdateOne
+
+from core.basemodel import BaseModel
+from core.config import settings
+from core.lib.index_manager import IndexManager
+from core.lib.query_cache import QueryCache
+from core.signals import pre_modify
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def normalize(text: str) -> str:
+    return "".join(
+        char
+        for char in unicodedata.normalize("NFKD", text)
+        if not unicodedata.combining(char)
+    ).casefold()
+
+
+def get_words(values: Iterable) -> list[str]:
+    words = []
+    for value in values:
+        if value:
+            words.extend(WORD_PATTERN.findall(normalize(str(value))))
+    return words
+
+
+def get_search_tokens(values: Iterable) -> list[str]:
+    tokens = set()
+    for word in get_words(values):
+        for size in range(1, min(len(word), settings.SEARCH_MAX_GRAM) + 1):
+            tokens.add(word[:size])
+    return sorted(tokens)
+
+
+def get_query_tokens(search_text: str) -> list[str]:
+    return list(
+        dict.fromkeys(
+            word[: settings.SEARCH_MAX_GRAM] for word in get_words([search_text])
+        )
+    )
+
+
+def get_search_update(model: type[BaseModel], update_fields: dict) -> dict:
+    if not issubclass(model, SearchableModel):
+        return {}
+    values = model.get_search_values(update_fields)
+    # tokens only depend on the update when it sets every search field
+    if len(values) != len(model.search_fields):
+        return {}
+    return {"search_tokens": get_search_tokens(values.values())}
+
+
+def apply_search(query_set: QuerySet, search_text: str) -> QuerySet:
+    if issubclass(query_set._document, SearchableModel):
+        return query_set.filter(**query_set._document.get_search_query(search_text))
+    return query_set.search_text(search_text)
+
+
+class SearchableModel(BaseModel):
+    meta = {"abstract": True}
+    search_fields: tuple[str, ...] = ()
+    search_tokens = ListField(StringField())
+
+    def get_search_tokens(self, **values) -> list[str]:
+        return get_search_tokens(
+            values[field] if field in values else getattr(self, field)
+            for field in self.search_fields
+        )
+
+    @classmethod
+    def get_search_values(cls, update_fields: dict) -> dict:
+        values = {}
+        for field in cls.search_fields:
+            if field in update_fields or f"set__{field}" in update_fields:
+                values[field] = update_fields.get(
+                    field, update_fields.get(f"set__{field}")
+                )
+            elif f"unset__{field}" in update_fields:
+                values[field] = None
+        return values
+
+    @classmethod
+    def get_search_query(cls, search_text: str) -> dict:
+        if tokens := get_query_tokens(search_text):
+            return {"search_tokens__all": tokens}
+        return {}
+
+
+class SearchIndexer:
+    @staticmethod
+    def get_models() -> list[type[SearchableModel]]:
+        return [
+            model
+            for model in IndexManager.get_models()
+            if issubclass(model, SearchableModel)
+        ]
+
+    @classmethod
+    def set_search_tokens(cls, sender, document: BaseModel, **kwargs):
+        if not isinstance(document, SearchableModel):
+            return
+        tokens = document.get_search_tokens()
+        if tokens != document.search_tokens:
+            document.search_tokens = tokens
+
+    @classmethod
+    def get_modified_search_tokens(
+        cls, sender, document: BaseModel, update_fields: dict, **kwargs
+    ) -> dict:
+        if not isinstance(document, SearchableModel):
+            return {}
+        if not (values := document.get_search_values(update_fields)):
+            return {}
+        return {"search_tokens": document.get_search_tokens(**values)}
+
+    @classmethod
+    def backfill(cls, model: type[SearchableModel], batch_size: int) -> int:
+        collection = model._get_collection()
+        db_fields = [model._fields[field].db_field for field in model.search_fields]
+        operations = []
+        updated = 0
+        for son in collection.find({}, projection=db_fields, batch_size=batch_size):
+            tokens = get_search_tokens(son.get(db_field) for db_field in db_fields)
+            operations.append(
+                UpdateOne({"_id": son["_id"]}, {"$set": {"search_tokens": tokens}})
+            )
+            if len(operations) >= batch_size:
+                updated += collection.bulk_write(
+                    operations, ordered=False
+                ).matched_count
+                operations = []
+        if operations:
+            updated += collection.bulk_write(operations, ordered=False).matched_count
+        QueryCache.invalidate_model(model)
+        return updated
+
+
+signals.pre_save.connect(SearchIndexer.set_search_tokens)
+pre_modify.connect(SearchIndexer.get_modified_search_tokens)
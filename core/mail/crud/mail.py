@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta
+
+from core.lib.basecrud import Crud
+from core.mail.enum import MailStatusEnum
+from core.mail.models.mail import MailOutbox
+
+
+class MailOutboxCrud(Crud):
+    model = MailOutbox
+
+    @classmethod
+    def create(cls, mail: dict) -> MailOutbox:
+        mail_model = cls.model(**mail)
+        mail_model.save()
+        return mail_model
+
+    @classmethod
+    def claim(cls, id: str) -> MailOutbox | None:
+        return cls.model.objects(
+            id=id, status=MailStatusEnum.PENDING, is_deleted=False
+        ).modify(
+            set__status=MailStatusEnum.SENDING,
+            set__locked_at=datetime.utcnow(),
+            inc__attempts=1,
+            new=True,
+        )
+
+    @classmethod
+    def create_many(cls, mails: list[dict]) -> list[str]:
+        return [
+            str(mail.id)
+            for mail in cls.model.objects.insert([cls.model(**mail) for mail in mails])
+        ]
+
+    @classmethod
+    def claim_many(cls, ids: list[str]) -> list[MailOutbox]:
+        return [mail for id in ids if (mail := cls.claim(id))]
+
+    @classmethod
+    def mark_many_sent(cls, mails: list[MailOutbox]):
+        now = datetime.utcnow()
+        cls.model.objects(id__in=[mail.id for mail in mails]).update(
+            set__status=MailStatusEnum.SENT,
+            set__sent_at=now,
+            set__updated_at=now,
+            unset__locked_at=True,
+            unset__last_error=True,
+        )
+
+    @classmethod
+    def mark_sent(cls, mail: MailOutbox):
+        now = datetime.utcnow()
+        mail.modify(
+            {
+                "status": MailStatusEnum.SENT,
+                "sent_at": now,
+                "locked_at": None,
+                "last_error": None,
+            }
+        )
+
+    @classmethod
+    def mark_failed(cls, mail: MailOutbox, error: Exception, retry_in: int | None):
+        update_fields = {"last_error": str(error), "locked_at": None}
+        if retry_in is None:
+            update_fields["status"] = MailStatusEnum.FAILED
+        else:
+            update_fields["status"] = MailStatusEnum.PENDING
+            update_fields["next_attempt_at"] = datetime.utcnow() + timedelta(
+                seconds=retry_in
+            )
+        mail.modify(update_fields)
+
+    @classmethod
+    def get_stale_ids(cls, pending_after: int, sending_after: int) -> list[str]:
+        now = datetime.utcnow()
+        cls.model.objects(
+            status=MailStatusEnum.SENDING,
+            locked_at__lt=now - timedelta(seconds=sending_after),
+            is_deleted=False,
+        ).update(set__status=MailStatusEnum.PENDING, set__locked_at=None)
+        return [
+            str(mail.id)
+            for mail in cls.model.objects(
+                status=MailStatusEnum.PENDING,
+                next_attempt_at__lt=now - timedelta(seconds=pending_after),
+                is_deleted=False,
+            ).only("id")
+        ]
@@ -0,0 +1,8 @@
+from core.base_enum import BaseStrEnum
+
+
+class MailStatusEnum(BaseStrEnum):
+    PENDING = "Pending"
+    SENDING = "Sending"
+    SENT = "Sent"
+    FAILED = "Failed"
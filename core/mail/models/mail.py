@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from mongoengine import DateTimeField, EnumField, IntField, StringField
+
+from core.basemodel import BaseModel, not_deleted_index
+from core.config import settings
+from core.mail.enum import MailStatusEnum
+
+
+class MailOutbox(BaseModel):
+    meta = {
+        "collection": "mail_outbox",
+        "indexes": [
+            not_deleted_index("status", "next_attempt_at"),
+            not_deleted_index("status", "locked_at"),
+            {
+                "fields": ["sent_at"],
+                "expireAfterSeconds": settings.MAIL_OUTBOX_RETENTION,
+            },
+        ],
+    }
+    to_email = StringField(required=True)
+    subject = StringField(required=True)
+    body = StringField(required=True)
+    status = EnumField(MailStatusEnum, default=MailStatusEnum.PENDING)
+    attempts = IntField(default=0)
+    last_error = StringField()
+    next_attempt_at = DateTimeField(default=datetime.utcnow)
+    locked_at = DateTimeField()
+    sent_at = DateTimeField()
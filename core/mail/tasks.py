@@ -0,0 +1,70 @@
+from core.celery_app import app
+from core.config import settings
+from core.functions import initialize_logger
+from core.mail.crud.mail import MailOutboxCrud
+from core.mail.models.mail import MailOutbox
+from core.mail.transport import MailTransport
+
+logger = initialize_logger()
+
+
+def handle_failure(mail: MailOutbox, error: Exception) -> int | None:
+    logger.error(f"Mail {mail.id} could not be sent: {error}")
+    if mail.attempts > settings.MAIL_MAX_RETRIES:
+        MailOutboxCrud.mark_failed(mail, error, retry_in=None)
+        return None
+    retry_in = settings.MAIL_RETRY_BACKOFF * 2 ** (mail.attempts - 1)
+    MailOutboxCrud.mark_failed(mail, error, retry_in=retry_in)
+    return retry_in
+
+
+@app.task(
+    bind=True, name="core.mail.tasks.deliver_mail", acks_late=True, max_retries=None
+)
+def deliver_mail(self, mail_id: str):
+    mail = MailOutboxCrud.claim(mail_id)
+    if mail is None:
+        return
+
+    try:
+        MailTransport.send(mail.to_email, mail.subject, mail.body)
+    except Exception as error:
+        if (retry_in := handle_failure(mail, error)) is not None:
+            raise self.retry(exc=error, countdown=retry_in)
+        return
+
+    MailOutboxCrud.mark_sent(mail)
+
+
+@app.task(name="core.mail.tasks.deliver_mail_batch", acks_late=True)
+def deliver_mail_batch(mail_ids: list[str]):
+    mails = MailOutboxCrud.claim_many(mail_ids)
+    if not mails:
+        return
+
+    try:
+        errors = MailTransport.send_many(
+            [
+                {"to_email": mail.to_email, "subject": mail.subject, "body": mail.body}
+                for mail in mails
+            ]
+        )
+    except Exception as error:
+        errors = [error] * len(mails)
+
+    MailOutboxCrud.mark_many_sent(
+        [mail for mail, error in zip(mails, errors) if error is None]
+    )
+    for mail, error in zip(mails, errors):
+        if error is not None and (retry_in := handle_failure(mail, error)):
+            deliver_mail.apply_async(args=[str(mail.id)], countdown=retry_in)
+
+
+@app.task(name="core.mail.tasks.redispatch_pending_mails")
+def redispatch_pending_mails():
+    mail_ids = MailOutboxCrud.get_stale_ids(
+        pending_after=settings.MAIL_REDISPATCH_AFTER,
+        sending_after=settings.MAIL_SENDING_TIMEOUT,
+    )
+    for index in range(0, len(mail_ids), settings.MAIL_BATCH_SIZE):
+        deliver_mail_batch.delay(mail_ids[index : index + settings.MAIL_BATCH_SIZE])
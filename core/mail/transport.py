@@ -0,0 +1,196 @@
+import hashlib
+import smtplib
+import ssl
+import threading
+import time
+from contextlib import contextmanager
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from queue import Empty, Full, Queue
+
+from core.auth.crud.configuration import ConfigurationCrud
+from core.config import settings
+from core.redis import Redis
+
+
+def build_message(from_email: str, to_email: str, subject: str, body: str) -> str:
+    message = MIMEMultipart()
+    message["From"] = from_email
+    message["To"] = to_email
+    message["Subject"] = subject
+    message.attach(MIMEText(body, "html"))
+    return message.as_string()
+
+
+def connect(configuration) -> smtplib.SMTP:
+    if settings.SMTP_HOST_OVERRIDE:
+        return smtplib.SMTP(settings.SMTP_HOST_OVERRIDE, settings.SMTP_PORT_OVERRIDE)
+
+    if configuration.use_ssl:
+        smtp_server = smtplib.SMTP_SSL(
+            configuration.server,
+            configuration.port,
+            context=ssl.create_default_context(),
+        )
+    else:
+        smtp_server = smtplib.SMTP(configuration.server, configuration.port)
+    smtp_server.ehlo()
+    smtp_server.login(configuration.email_address, configuration.password)
+    return smtp_server
+
+
+def get_fingerprint(configuration) -> str:
+    values = (
+        configuration.server,
+        configuration.port,
+        configuration.email_address,
+        configuration.password,
+        configuration.use_ssl,
+        settings.SMTP_HOST_OVERRIDE,
+        settings.SMTP_PORT_OVERRIDE,
+    )
+    return hashlib.sha256(repr(values).encode()).hexdigest()
+
+
+class SmtpConnection:
+    def __init__(self, smtp_server: smtplib.SMTP):
+        self.smtp_server = smtp_server
+        self.sent = 0
+        self.last_used_at = time.monotonic()
+
+    def is_healthy(self) -> bool:
+        if self.sent >= settings.SMTP_CONNECTION_MAX_MESSAGES:
+            return False
+        if time.monotonic() - self.last_used_at < settings.SMTP_HEALTH_CHECK_AFTER:
+            return True
+        try:
+            return self.smtp_server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def close(self):
+        try:
+            self.smtp_server.quit()
+        except (smtplib.SMTPException, OSError):
+            self.smtp_server.close()
+
+
+class SmtpConnectionPool:
+    def __init__(self, configuration, size: int):
+        self.configuration = configuration
+        self._idle: Queue[SmtpConnection] = Queue(maxsize=size)
+
+    @contextmanager
+    def connection(self):
+        connection = self._acquire()
+        try:
+            yield connection
+        except Exception:
+            connection.close()
+            raise
+        connection.last_used_at = time.monotonic()
+        try:
+            self._idle.put_nowait(connection)
+        except Full:
+            connection.close()
+
+    def send(self, to_email: str, subject: str, body: str):
+        [error] = self.send_many(
+            [{"to_email": to_email, "subject": subject, "body": body}]
+        )
+        if error:
+            raise error
+
+    def send_many(self, messages: list[dict]) -> list[Exception | None]:
+        errors = []
+        try:
+            with self.connection() as connection:
+                for message in messages:
+                    try:
+                        self._send(connection, **message)
+                    except (
+                        smtplib.SMTPRecipientsRefused,
+                        smtplib.SMTPResponseException,
+                    ) as error:
+                        errors.append(error)
+                        continue
+                    except (smtplib.SMTPServerDisconnected, OSError):
+                        connection.close()
+                        connection = self._reconnect(connection)
+                        try:
+                            self._send(connection, **message)
+                        except Exception as error:
+                            errors.append(error)
+                            continue
+                    errors.append(None)
+        except (smtplib.SMTPException, OSError) as error:
+            errors.extend([error] * (len(messages) - len(errors)))
+        return errors
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except Empty:
+                return
+
+    def _send(self, connection: SmtpConnection, to_email: str, subject: str, body: str):
+        from_email = self.configuration.email_address
+        connection.smtp_server.sendmail(
+            from_email, to_email, build_message(from_email, to_email, subject, body)
+        )
+        connection.sent += 1
+
+    def _reconnect(self, connection: SmtpConnection) -> SmtpConnection:
+        connection.smtp_server = connect(self.configuration)
+        connection.sent = 0
+        return connection
+
+    def _acquire(self) -> SmtpConnection:
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except Empty:
+                return SmtpConnection(connect(self.configuration))
+            if connection.is_healthy():
+                return connection
+            connection.close()
+
+
+class MailTransport:
+    version_key = "mail_configuration_version"
+    _pool: SmtpConnectionPool | None = None
+    _fingerprint: str | None = None
+    _version: str | None = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def send(cls, to_email: str, subject: str, body: str):
+        cls.get_pool().send(to_email, subject, body)
+
+    @classmethod
+    def send_many(cls, messages: list[dict]) -> list[Exception | None]:
+        return cls.get_pool().send_many(messages)
+
+    @classmethod
+    def get_pool(cls) -> SmtpConnectionPool:
+        version = Redis.get(cls.version_key)
+        with cls._lock:
+            if cls._pool is None or version != cls._version:
+                configuration = ConfigurationCrud.get_partial(
+                    {}, ["email_configuration"]
+                ).email_configuration
+                fingerprint = get_fingerprint(configuration)
+                if fingerprint != cls._fingerprint:
+                    if cls._pool is not None:
+                        cls._pool.close()
+                    cls._pool = SmtpConnectionPool(
+                        configuration, settings.SMTP_POOL_SIZE
+                    )
+                    cls._fingerprint = fingerprint
+                cls._version = version
+            return cls._pool
+
+    @classmethod
+    def invalidate_configuration(cls, sender, document, **kwargs):
+        Redis.incr(cls.version_key)
@@ -1,22 +1,38 @@
 import logging
 import sys
+import threading
 from datetime import datetime
 from functools import cached_property
 
 import strawberry
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from mongoengine import connect
+from mongoengine import connect, signals
 from strawberry.fastapi import BaseContext, GraphQLRouter
 from core.storage_management.routers.storage import storage
-from core.auth.crud.user import UserCrud
+from core.export_management.routers.export import export
+from core.auth.models.account import Account
+from core.auth.models.configuration import Configuration
+from core.auth.models.role import Role
 from core.auth.models.user import User
 from core.auth.utilities.auth_handler import AuthHandler
+from core.auth.utilities.principal_cache import PrincipalCache
 from core.config import settings
 from core.graphql_base_model import DateTimeWithTimezone
+from core.graphql_extensions import OperationNameExtension, RateLimitExtension
+from core.lib.dataloader import ReferenceLoaders
+from core.lib.index_manager import IndexManager
 from core.logging.config import configure_colorized_logging
+from core.mail.transport import MailTransport
+from core.monitoring.slow_query import SlowQueryListener
 from core.mutations import Mutations
 from core.query import Query
+from core.signals import (
+    post_bulk_create,
+    post_bulk_delete,
+    post_bulk_modify,
+    post_modify,
+)
 
 logging.config.fileConfig("logging.conf", disable_existing_loggers=False)
 configure_colorized_logging()
@@ -24,7 +40,9 @@ sys.path.append("/core")
 
 API_PREFIX = "/api/v1"
 
-client = connect("app", host="mongodb://mongo:27017/")
+client = connect(
+    "app", host="mongodb://mongo:27017/", event_listeners=[SlowQueryListener()]
+)
 
 origins = [
     settings.ALLOW_HOST,
@@ -33,13 +51,21 @@ origins = [
 
 class Context(BaseContext):
     @cached_property
-    def user(self) -> User | None:
+    def token_payload(self) -> dict | None:
         if not self.request:
             return None
 
         authorization = self.request.headers.get("Authorization")
-        email = AuthHandler.decode_token(token=authorization, scope="access_token")
-        return UserCrud.get(email=email)
+        return AuthHandler.decode_token_payload(
+            token=authorization, scope="access_token"
+        )
+
+    @cached_property
+    def user(self) -> User | None:
+        if not (payload := self.token_payload):
+            return None
+
+        return PrincipalCache.get(payload["sub"], payload["iat"], payload["exp"])
 
     @cached_property
     def source_info(self) -> dict | None:
@@ -47,10 +73,31 @@ class Context(BaseContext):
         user_agent = self.request.headers.get("user-agent")
         return {"source_address": source_address, "user_agent": user_agent}
 
+    @cached_property
+    def loaders(self) -> ReferenceLoaders:
+        return ReferenceLoaders()
+
 
 app = FastAPI()
 auth_handler = AuthHandler()
 
+
+@app.on_event("startup")
+def create_indexes():
+    IndexManager.create_missing_indexes(unique_only=True)
+    threading.Thread(target=IndexManager.create_missing_indexes, daemon=True).start()
+
+
+for signal in (signals.post_save, post_modify, signals.post_delete):
+    signal.connect(PrincipalCache.invalidate_user, sender=User)
+    signal.connect(PrincipalCache.invalidate_role, sender=Role)
+    signal.connect(PrincipalCache.invalidate_account, sender=Account)
+    signal.connect(MailTransport.invalidate_configuration, sender=Configuration)
+
+for signal in (post_bulk_modify, post_bulk_delete):
+    for sender in (User, Role, Account):
+        signal.connect(PrincipalCache.invalidate_many, sender=sender)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -63,6 +110,7 @@ app.add_middleware(
 schema = strawberry.Schema(
     query=Query,
     mutation=Mutations,
+    extensions=[OperationNameExtension, RateLimitExtension],
     scalar_overrides={
         datetime: DateTimeWithTimezone,
     },
@@ -81,4 +129,5 @@ graphql_app = GraphQLRouter(
 app.include_router(graphql_app, prefix="/graphql")
 app.add_websocket_route("/graphql", graphql_app)
 
-app.include_router(storage.router, prefix=API_PREFIX)
\ No newline at end of file
+app.include_router(storage.router, prefix=API_PREFIX)
+app.include_router(export.router, prefix=API_PREFIX)
\ No newline at end of file
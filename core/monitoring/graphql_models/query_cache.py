@@ -0,0 +1,31 @@
+import strawberry
+
+from core.base_graphql_error import AuthenticationExceptionType, BaseErrorType
+
+
+@strawberry.type
+class QueryCacheStatsRead:
+    collection: str
+    hits: int
+    misses: int
+    hit_rate: float
+    generation: int
+
+
+@strawberry.type
+class QueryCacheStatsList:
+    response: list[QueryCacheStatsRead]
+
+
+############################################
+########## Mutation Return Types ###########
+############################################
+
+QueryCacheStatsListResponse = strawberry.union(
+    "QueryCacheStatsListResponse",
+    (
+        QueryCacheStatsList,
+        BaseErrorType,
+        AuthenticationExceptionType,
+    ),
+)
@@ -0,0 +1,37 @@
+from typing import Optional
+
+import strawberry
+
+from core.base_graphql_error import AuthenticationExceptionType, BaseErrorType
+
+
+@strawberry.type
+class SlowQueryRead:
+    operation: Optional[str]
+    command: str
+    collection: Optional[str]
+    shape: str
+    count: int
+    docs: int
+    last_ms: float
+    max_ms: float
+    avg_ms: float
+
+
+@strawberry.type
+class SlowQueryList:
+    response: list[SlowQueryRead]
+
+
+############################################
+########## Mutation Return Types ###########
+############################################
+
+SlowQueryListResponse = strawberry.union(
+    "SlowQueryListResponse",
+    (
+        SlowQueryList,
+        BaseErrorType,
+        AuthenticationExceptionType,
+    ),
+)
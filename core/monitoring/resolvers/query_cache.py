@@ -0,0 +1,25 @@
+from strawberry.types import Info
+
+from core.auth.models.permission import PermissionsEnum
+from core.auth.utilities.decorators import check_perm
+from core.graphql_decorator import graphql_exception_handler
+from core.lib.query_cache import QueryCache
+from core.monitoring.graphql_models.query_cache import (
+    QueryCacheStatsList,
+    QueryCacheStatsListResponse,
+    QueryCacheStatsRead,
+)
+
+
+@graphql_exception_handler
+@check_perm(PermissionsEnum.MONITORING_READ_VALUES)
+def resolve_query_cache_stats(info: Info) -> QueryCacheStatsListResponse:
+    return QueryCacheStatsList(
+        response=[
+            QueryCacheStatsRead(
+                **stats,
+                hit_rate=stats["hits"] / (stats["hits"] + stats["misses"] or 1),
+            )
+            for stats in QueryCache.get_stats()
+        ]
+    )
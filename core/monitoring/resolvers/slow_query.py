@@ -0,0 +1,33 @@
+from strawberry.types import Info
+
+from core.auth.models.permission import PermissionsEnum
+from core.auth.utilities.decorators import check_perm
+from core.config import settings
+from core.graphql_decorator import graphql_exception_handler
+from core.monitoring.graphql_models.slow_query import (
+    SlowQueryList,
+    SlowQueryListResponse,
+    SlowQueryRead,
+)
+from core.monitoring.slow_query import SlowQueryLog
+
+
+@graphql_exception_handler
+@check_perm(PermissionsEnum.MONITORING_READ_VALUES)
+def resolve_slow_queries(info: Info, limit: int = 20) -> SlowQueryListResponse:
+    return SlowQueryList(
+        response=[
+            SlowQueryRead(
+                operation=entry["operation"] or None,
+                command=entry["command"],
+                collection=entry["collection"] or None,
+                shape=entry["shape"],
+                count=int(entry["count"]),
+                docs=int(entry["docs"]),
+                last_ms=float(entry["last_ms"]),
+                max_ms=entry["max_ms"],
+                avg_ms=float(entry["total_ms"]) / int(entry["count"]),
+            )
+            for entry in SlowQueryLog.get_top(min(limit, settings.SLOW_QUERY_TOP_N))
+        ]
+    )
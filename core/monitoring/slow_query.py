@@ -0,0 +1,187 @@
+import hashlib
+import json
+import logging
+from contextvars import ContextVar
+
+from pymongo import monitoring
+from redis.exceptions import RedisError
+
+from core.config import settings
+from core.redis import Redis
+
+logger = logging.getLogger("colorizedLogger")
+
+current_operation: ContextVar[str | None] = ContextVar(
+    "current_operation", default=None
+)
+
+COMMAND_SHAPE_FIELDS = {
+    "find": ("filter", "sort", "projection"),
+    "aggregate": ("pipeline",),
+    "count": ("query",),
+    "distinct": ("key", "query"),
+    "findAndModify": ("query", "sort", "update"),
+    "update": ("updates",),
+    "delete": ("deletes",),
+    "insert": (),
+    "getMore": (),
+}
+
+RAW_SHAPE_FIELDS = {"sort", "projection", "key", "$sort", "$project"}
+
+RECORD_SLOW_QUERY_SCRIPT = """
+local duration = tonumber(ARGV[2])
+redis.call("HSET", KEYS[2],
+    "command", ARGV[4], "collection", ARGV[5], "shape", ARGV[6],
+    "operation", ARGV[7], "last_ms", ARGV[2], "docs", ARGV[3])
+redis.call("HINCRBY", KEYS[2], "count", 1)
+redis.call("HINCRBYFLOAT", KEYS[2], "total_ms", duration)
+redis.call("EXPIRE", KEYS[2], ARGV[8])
+local current = tonumber(redis.call("ZSCORE", KEYS[1], ARGV[1]))
+if not current or duration > current then
+    redis.call("ZADD", KEYS[1], duration, ARGV[1])
+end
+redis.call("EXPIRE", KEYS[1], ARGV[8])
+local evicted = redis.call("ZRANGE", KEYS[1], 0, -tonumber(ARGV[9]) - 1)
+for _, member in ipairs(evicted) do
+    redis.call("DEL", ARGV[10] .. member)
+end
+if #evicted > 0 then
+    redis.call("ZREMRANGEBYRANK", KEYS[1], 0, #evicted - 1)
+end
+return #evicted
+"""
+
+
+def get_shape(value):
+    if isinstance(value, dict):
+        return {
+            key: item if key in RAW_SHAPE_FIELDS else get_shape(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        shapes = []
+        for item in value:
+            if (shape := get_shape(item)) not in shapes:
+                shapes.append(shape)
+        return shapes
+    return "?"
+
+
+def get_command_shape(command_name: str, command: dict) -> str:
+    shape = get_shape(
+        {
+            field: command[field]
+            for field in COMMAND_SHAPE_FIELDS[command_name]
+            if field in command
+        }
+    )
+    return json.dumps(shape, sort_keys=True, default=str)
+
+
+def get_command_collection(command_name: str, command: dict) -> str | None:
+    collection = command.get(
+        "collection" if command_name == "getMore" else command_name
+    )
+    return collection if isinstance(collection, str) else None
+
+
+def get_document_count(reply: dict) -> int:
+    if cursor := reply.get("cursor"):
+        return len(cursor.get("firstBatch", cursor.get("nextBatch", [])))
+    if "values" in reply:
+        return len(reply["values"])
+    if "value" in reply:
+        return int(reply["value"] is not None)
+    return reply.get("n", 0)
+
+
+class SlowQueryLog:
+    key = "slow_queries"
+    prefix = "slow_query:"
+    _script = None
+
+    @classmethod
+    def get_script(cls):
+        if cls._script is None:
+            cls._script = Redis.register_script(RECORD_SLOW_QUERY_SCRIPT)
+        return cls._script
+
+    @classmethod
+    def record(
+        cls,
+        command_name: str,
+        collection: str | None,
+        shape: str,
+        operation: str | None,
+        duration_ms: float,
+        docs: int,
+    ):
+        member = hashlib.sha1(
+            f"{operation}|{command_name}|{collection}|{shape}".encode()
+        ).hexdigest()
+        cls.get_script()(
+            keys=[cls.key, f"{cls.prefix}{member}"],
+            args=[
+                member,
+                round(duration_ms, 3),
+                docs,
+                command_name,
+                collection or "",
+                shape,
+                operation or "",
+                settings.SLOW_QUERY_TTL,
+                settings.SLOW_QUERY_TOP_N,
+                cls.prefix,
+            ],
+        )
+
+    @classmethod
+    def get_top(cls, limit: int) -> list[dict]:
+        members = Redis.get_top_members(cls.key, limit)
+        pipeline = Redis.pipeline(transaction=False)
+        for member, _ in members:
+            pipeline.get_hash(f"{cls.prefix}{member}")
+        return [
+            {**entry, "max_ms": max_ms}
+            for (_, max_ms), entry in zip(members, pipeline.execute())
+            if entry
+        ]
+
+
+class SlowQueryListener(monitoring.CommandListener):
+    def __init__(self):
+        self._started = {}
+
+    def started(self, event):
+        if event.command_name in COMMAND_SHAPE_FIELDS:
+            self._started[(event.connection_id, event.request_id)] = (
+                event.command,
+                current_operation.get(),
+            )
+
+    def succeeded(self, event):
+        self._finish(event, event.reply)
+
+    def failed(self, event):
+        self._finish(event, {})
+
+    def _finish(self, event, reply: dict):
+        started = self._started.pop((event.connection_id, event.request_id), None)
+        duration_ms = event.duration_micros / 1000
+        if started is None or duration_ms < settings.SLOW_QUERY_THRESHOLD_MS:
+            return
+        command, operation = started
+        collection = get_command_collection(event.command_name, command)
+        shape = get_command_shape(event.command_name, command)
+        docs = get_document_count(reply)
+        logger.warning(
+            f"Slow {event.command_name} on {collection} took {duration_ms:.1f}ms "
+            f"({docs} docs, operation {operation}): {shape}"
+        )
+        try:
+            SlowQueryLog.record(
+                event.command_name, collection, shape, operation, duration_ms, docs
+            )
+        except RedisError:
+            logger.exception("Could not record slow query")
@@ -0,0 +1,14 @@
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from core.monitoring.slow_query import SlowQueryListener
+
+
+class Motor:
+    _client = AsyncIOMotorClient(
+        "mongodb://mongo:27017/", event_listeners=[SlowQueryListener()]
+    )
+    _db = _client["app"]
+
+    @classmethod
+    def get_collection(cls, name: str):
+        return cls._db[name]
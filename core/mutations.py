@@ -13,16 +13,21 @@ from core.auth.resolvers.configuration import (
 from core.auth.resolvers.role import (
     resolve_create_role,
     resolve_delete_role,
+    resolve_restore_role,
     resolve_update_role,
+    resolve_update_roles,
 )
 from core.auth.resolvers.user import (
     resolve_create_user,
+    resolve_create_users,
     resolve_delete_user,
+    resolve_delete_users,
     resolve_generate_one_time_token,
     resolve_get_token_by_one_time_token,
     resolve_login,
     resolve_refresh_token,
     resolve_reset_password,
+    resolve_restore_user,
     resolve_update_self_user,
     resolve_update_user,
     resolve_verify_auth,
@@ -39,12 +44,17 @@ class Mutations:
 
     create_role = strawberry.mutation(resolver=resolve_create_role)
     update_role = strawberry.mutation(resolver=resolve_update_role)
+    update_roles = strawberry.mutation(resolver=resolve_update_roles)
     delete_role = strawberry.mutation(resolver=resolve_delete_role)
+    restore_role = strawberry.mutation(resolver=resolve_restore_role)
 
     create_user = strawberry.mutation(resolver=resolve_create_user)
+    create_users = strawberry.mutation(resolver=resolve_create_users)
     update_user = strawberry.mutation(resolver=resolve_update_user)
     update_self_user = strawberry.mutation(resolver=resolve_update_self_user)
     delete_user = strawberry.mutation(resolver=resolve_delete_user)
+    delete_users = strawberry.mutation(resolver=resolve_delete_users)
+    restore_user = strawberry.mutation(resolver=resolve_restore_user)
     login = strawberry.mutation(resolver=resolve_login)
     verify_auth = strawberry.mutation(resolver=resolve_verify_auth)
     generate_new_token = strawberry.mutation(resolver=resolve_refresh_token)
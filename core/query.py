@@ -7,6 +7,8 @@ from core.auth.resolvers.permission import resolve_permissions
 from core.auth.resolvers.role import resolve_roles
 from core.auth.resolvers.user import resolve_me_info, resolve_users
 from core.auth.resolvers.webauthn import resolve_webauthn_credentials
+from core.monitoring.resolvers.query_cache import resolve_query_cache_stats
+from core.monitoring.resolvers.slow_query import resolve_slow_queries
 
 
 @strawberry.type
@@ -19,3 +21,5 @@ class Query:
     accounts = strawberry.field(resolver=resolve_account)
     webauthn_credentials = strawberry.field(resolver=resolve_webauthn_credentials)
     configurations = strawberry.field(resolver=resolve_configuration)
+    slow_queries = strawberry.field(resolver=resolve_slow_queries)
+    query_cache_stats = strawberry.field(resolver=resolve_query_cache_stats)
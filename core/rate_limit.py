@@ -0,0 +1,72 @@
+import math
+import time
+
+from core.config import settings
+from core.redis import Redis
+
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local now = tonumber(ARGV[4])
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "updated_at")
+local tokens = tonumber(bucket[1]) or capacity
+local updated_at = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * rate / 1000)
+local allowed = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+end
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "updated_at", now)
+redis.call("PEXPIRE", KEYS[1], math.ceil((capacity - tokens) * 1000 / rate) + 1000)
+return {allowed, tostring(tokens)}
+"""
+
+OPERATION_COSTS = {
+    "login": 20,
+    "verifyAuth": 10,
+    "createUser": 20,
+    "createUsers": 20,
+    "resetPassword": 20,
+    "updateSelfUser": 10,
+    "generateNewToken": 5,
+    "getTokenFromOneTimeToken": 5,
+    "webauthnGenerateAuthenticationOptions": 5,
+    "webauthnVerifyRegistrationResponse": 5,
+    "users": 1,
+    "roles": 1,
+    "audits": 1,
+}
+
+
+class RateLimiter:
+    prefix = "rate_limit"
+    capacity = settings.RATE_LIMIT_CAPACITY
+    refill_rate = settings.RATE_LIMIT_REFILL_RATE
+    default_cost = 1
+    _script = None
+
+    @classmethod
+    def get_script(cls):
+        if cls._script is None:
+            cls._script = Redis.register_script(TOKEN_BUCKET_SCRIPT)
+        return cls._script
+
+    @classmethod
+    def get_cost(cls, field_names: list[str]) -> int:
+        cost = sum(
+            OPERATION_COSTS.get(field_name, cls.default_cost)
+            for field_name in field_names
+        )
+        return min(cost, cls.capacity)
+
+    @classmethod
+    def consume(cls, client: str, cost: int) -> int | None:
+        allowed, tokens = cls.get_script()(
+            keys=[f"{cls.prefix}:{client}"],
+            args=[cls.capacity, cls.refill_rate, cost, int(time.time() * 1000)],
+        )
+        if allowed:
+            return None
+        return math.ceil((cost - float(tokens)) / cls.refill_rate)
@@ -1,6 +1,74 @@
 import redis
 
 
+def _decode(value):
+    return value and value.decode("utf-8")
+
+
+def _raw(value):
+    return value
+
+
+def _decode_set(value):
+    return {member.decode("utf-8") for member in value}
+
+
+def _decode_hash(value):
+    return {
+        field.decode("utf-8"): item.decode("utf-8") for field, item in value.items()
+    }
+
+
+class RedisPipeline:
+    def __init__(self, pipeline):
+        self._pipeline = pipeline
+        self._decoders = []
+
+    def get(self, key):
+        self._pipeline.get(key)
+        self._decoders.append(_decode)
+        return self
+
+    def get_raw(self, key):
+        self._pipeline.get(key)
+        self._decoders.append(_raw)
+        return self
+
+    def set(self, key, value, exp=None):
+        self._pipeline.set(key, value, ex=exp)
+        self._decoders.append(_raw)
+        return self
+
+    def delete(self, *keys):
+        if keys:
+            self._pipeline.delete(*keys)
+            self._decoders.append(_raw)
+        return self
+
+    def add_to_set(self, key, *members, exp=None):
+        self._pipeline.sadd(key, *members)
+        self._decoders.append(_raw)
+        if exp:
+            self._pipeline.expire(key, exp)
+            self._decoders.append(_raw)
+        return self
+
+    def get_set_members(self, key):
+        self._pipeline.smembers(key)
+        self._decoders.append(_decode_set)
+        return self
+
+    def get_hash(self, key):
+        self._pipeline.hgetall(key)
+        self._decoders.append(_decode_hash)
+        return self
+
+    def execute(self) -> list:
+        results = self._pipeline.execute()
+        self._decoders, decoders = [], self._decoders
+        return [decoder(result) for decoder, result in zip(decoders, results)]
+
+
 class Redis:
     _redis = redis.Redis(host="redis", port=6379, db=0)
 
@@ -21,6 +89,10 @@ class Redis:
             return message["data"].decode("utf-8")
         return None
 
+    @classmethod
+    def pipeline(cls, transaction: bool = True) -> RedisPipeline:
+        return RedisPipeline(cls._redis.pipeline(transaction=transaction))
+
     @classmethod
     def get(cls, key):
         value = cls._redis.get(key)
@@ -34,10 +106,56 @@ class Redis:
     def set(cls, key, value, exp=None):
         cls._redis.set(key, value, ex=exp)
 
+    @classmethod
+    def incr(cls, key) -> int:
+        return cls._redis.incr(key)
+
     @classmethod
     def exists(cls, key):
         return cls._redis.exists(key)
 
     @classmethod
-    def delete(cls, key):
-        cls._redis.delete(key)
+    def delete(cls, *keys):
+        if keys:
+            cls._redis.delete(*keys)
+
+    @classmethod
+    def add_to_set(cls, key, *members, exp=None):
+        cls.pipeline(transaction=False).add_to_set(key, *members, exp=exp).execute()
+
+    @classmethod
+    def get_set_members(cls, key):
+        return {member.decode("utf-8") for member in cls._redis.smembers(key)}
+
+    @classmethod
+    def get_hash(cls, key) -> dict:
+        return {
+            field.decode("utf-8"): value.decode("utf-8")
+            for field, value in cls._redis.hgetall(key).items()
+        }
+
+    @classmethod
+    def get_top_members(cls, key, count: int) -> list[tuple[str, float]]:
+        return [
+            (member.decode("utf-8"), score)
+            for member, score in cls._redis.zrevrange(
+                key, 0, count - 1, withscores=True
+            )
+        ]
+
+    @classmethod
+    def register_script(cls, script: str):
+        return cls._redis.register_script(script)
+
+    @classmethod
+    def scan_keys(cls, pattern: str):
+        for key in cls._redis.scan_iter(match=pattern, count=500):
+            yield key.decode("utf-8")
+
+    @classmethod
+    def memory_usage(cls, key) -> int:
+        return cls._redis.memory_usage(key) or 0
+
+    @classmethod
+    def hash_length(cls, key) -> int:
+        return cls._redis.hlen(key)
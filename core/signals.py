@@ -1,4 +1,8 @@
 from mongoengine import signals
 
+pre_modify = signals._signals.signal("pre_modify")
 post_modify = signals._signals.signal("post_modify")
 non_db_signal = signals._signals.signal("non-db-signal")
+post_bulk_create = signals._signals.signal("post_bulk_create")
+post_bulk_modify = signals._signals.signal("post_bulk_modify")
+post_bulk_delete = signals._signals.signal("post_bulk_delete")
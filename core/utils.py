@@ -1,6 +1,7 @@
 import re
 from functools import wraps
 
+from mongoengine.base import BaseDocument
 from strawberry.types import Info
 from strawberry.types.nodes import InlineFragment
 
@@ -25,6 +26,12 @@ def get_requested_fields(info: Info, object_type: str, inner_object="response")
                     }
 
 
+def is_field_requested(
+    info: Info, object_type: str, field: str, inner_object="meta"
+) -> bool:
+    return field in (get_requested_fields(info, object_type, inner_object) or set())
+
+
 def db_to_graphql_type_converter(graphql_return_type):
     def decorator(func):
         @wraps(func)
@@ -38,5 +45,21 @@ def db_to_graphql_type_converter(graphql_return_type):
 
 
 def convert_to_graphql_type(db_model_object, graphql_return_type):
-    fields = graphql_return_type.__dict__["__dataclass_fields__"].keys()
-    return graphql_return_type(**{f: getattr(db_model_object, f) for f in fields})
+    fields = graphql_return_type.__dict__["__dataclass_fields__"].values()
+    instance = graphql_return_type(
+        **{
+            f.name: getattr(db_model_object, f.name)
+            for f in fields
+            if f.init and hasattr(db_model_object, f.name)
+        }
+    )
+    for field in fields:
+        if not field.init:
+            instance.__dict__[field.name] = get_raw_value(db_model_object, field.name)
+    return instance
+
+
+def get_raw_value(db_model_object, name: str):
+    if isinstance(db_model_object, BaseDocument):
+        return db_model_object._data.get(name)
+    return getattr(db_model_object, name, None)
@@ -0,0 +1,49 @@
+import sys
+
+from mongoengine import connect
+
+from core.audit.models.audit import Audit
+from core.auth.models.account import Account
+from core.auth.models.configuration import Configuration
+from core.auth.models.role import Role
+from core.auth.models.user import User
+from core.lib.index_manager import IndexManager
+from core.mail.models.mail import MailOutbox
+
+client = connect("app", host="mongodb://mongo:27017/")
+
+MODELS = [Account, Audit, Configuration, MailOutbox, Role, User]
+
+
+def create():
+    created = IndexManager.create_missing_indexes(MODELS)
+    for collection, names in created.items():
+        print(f"{collection}\t{', '.join(names)}")
+    if not created:
+        print("All declared indexes exist")
+
+
+def report():
+    for row in IndexManager.report(MODELS):
+        print(
+            f"{row['collection']}\t{row['name']}\t{row['status']}"
+            f"\t{row.get('ops', '-')}\t{row.get('since') or '-'}"
+        )
+
+
+def help():
+    print("Usage: indexes.py [option]")
+    print("Options:")
+    print("\tcreate\t\tBuild declared indexes that are missing")
+    print("\treport\t\tShow missing, unused, redundant and undeclared indexes")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        help()
+    elif sys.argv[1] == "create":
+        create()
+    elif sys.argv[1] == "report":
+        report()
+    else:
+        help()
@@ -0,0 +1,37 @@
+import sys
+
+from mongoengine import connect
+
+from core.audit.models.audit import Audit
+from core.auth.models.account import Account
+from core.auth.models.role import Role
+from core.auth.models.user import User
+from core.config import settings
+from core.lib.search import SearchIndexer
+
+client = connect("app", host="mongodb://mongo:27017/")
+
+MODELS = [Account, Audit, Role, User]
+
+
+def backfill(names: list[str]):
+    for model in MODELS:
+        if names and model._get_collection_name() not in names:
+            continue
+        updated = SearchIndexer.backfill(model, settings.SEARCH_BACKFILL_BATCH_SIZE)
+        print(f"{model._get_collection_name()}\t{updated}")
+
+
+def help():
+    print("Usage: search.py [option] [collection ...]")
+    print("Options:")
+    print("\tbackfill\tRebuild search tokens of all or the given collections")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        help()
+    elif sys.argv[1] == "backfill":
+        backfill(sys.argv[2:])
+    else:
+        help()
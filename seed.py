@@ -3,6 +3,7 @@ import sys
 from mongoengine import connect
 
 import core.seeders as seeders
+from core.lib.index_manager import IndexManager
 
 client = connect("app", host="mongodb://mongo:27017/")
 
@@ -13,6 +14,7 @@ TABLES = {
 
 
 def seed(table=None):
+    IndexManager.create_missing_indexes(unique_only=True)
     if table:
         TABLES[table].seed()
         print(f"Seeded {table}")
@@ -44,6 +46,7 @@ def validate_table(table):
 
 
 def update(table):
+    IndexManager.create_missing_indexes(unique_only=True)
     if table:
         TABLES[table].update()
         print(f"Updated {table}")
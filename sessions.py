@@ -0,0 +1,30 @@
+import sys
+
+from core.auth.utilities.session_store import SessionStore
+
+
+def report():
+    for name, value in SessionStore.memory_report().items():
+        print(f"{name}\t{value}")
+
+
+def purge_legacy():
+    print(f"Purged {SessionStore.purge_legacy_keys()} legacy session keys")
+
+
+def help():
+    print("Usage: sessions.py [option]")
+    print("Options:")
+    print("\treport\t\tShow session store memory usage")
+    print("\tpurge-legacy\tDelete email-prefixed session keys")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        help()
+    elif sys.argv[1] == "report":
+        report()
+    elif sys.argv[1] == "purge-legacy":
+        purge_legacy()
+    else:
+        help()